@@ -1,27 +1,202 @@
-import time
-from typing import Dict, List, Optional, Tuple
+import asyncio
+import warnings
+from typing import Dict, Iterable, Iterator, List, Optional, Sized, Tuple
 
 from loguru import logger
 from tqdm import tqdm
 
 from knowledge_graph_creator.db_neo4j.academic_graph import AcademicKnowledgeGraph
 from knowledge_graph_creator.extractors.reference_details import ReferenceDetails
+from knowledge_graph_creator.rate_limiter import RateLimiter
 from knowledge_graph_creator.semantic_scholar_client import SemanticScholarClient
+from knowledge_graph_creator.utils import normalize_title, run_sync
+
+
+def _richness(paper: dict) -> int:
+    """Count the populated fields of a paper record."""
+    return sum(1 for value in paper.values() if value not in (None, "", [], {}))
+
+
+def _unique_references(
+    references: Iterable[ReferenceDetails],
+) -> Iterator[ReferenceDetails]:
+    """Lazily drop references whose normalised title was already seen."""
+    seen = set()
+    for reference in references:
+        key = normalize_title(reference.title) or id(reference)
+        if key not in seen:
+            seen.add(key)
+            yield reference
+
+
+def _warn_rate_limit_delay(rate_limit_delay: Optional[float]):
+    """Warn callers still passing the deprecated `rate_limit_delay` argument."""
+    if rate_limit_delay is not None:
+        warnings.warn(
+            "rate_limit_delay is ignored; configure the SemanticScholarClient "
+            "rate limiter instead.",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+
+
+async def _put_while_writing(queue: asyncio.Queue, item, writer: asyncio.Task):
+    """
+    Put `item` on the write queue, unless the writer consuming it has stopped.
+
+    Waiting on a bounded queue whose only consumer has died would block
+    forever, so the put is raced against the writer task and the writer's
+    exception is re-raised if it finishes first.
+    """
+    if not writer.done():
+        put = asyncio.ensure_future(queue.put(item))
+        await asyncio.wait({put, writer}, return_when=asyncio.FIRST_COMPLETED)
+        if put.done():
+            return
+        put.cancel()
+    writer.result()
+    raise RuntimeError("Neo4j write worker stopped before the pipeline finished.")
+
+
+async def _finish_writer(queue: asyncio.Queue, writer: asyncio.Task):
+    """Send the end-of-stream sentinel to a live writer and wait for it."""
+    if not writer.done():
+        await _put_while_writing(queue, None, writer)
+    await writer
+
+
+class _PaperRegistry:
+    """
+    Tracks the papers queued during a run, deduplicated by paperId and then by
+    normalised title so preprint/published duplicates map to one node.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, str] = {}
+        self._titles: Dict[str, str] = {}
+
+    def register(self, paper: dict) -> Tuple[str, bool]:
+        """
+        Args:
+            paper: Semantic Scholar paper JSON with a paperId
+
+        Returns:
+            Tuple of (canonical_paper_id, is_new)
+        """
+        paper_id = paper["paperId"]
+        if paper_id in self._ids:
+            return self._ids[paper_id], False
+
+        title = normalize_title(paper.get("title"))
+        canonical_id = self._titles.setdefault(title, paper_id) if title else paper_id
+        self._ids[paper_id] = canonical_id
+        return canonical_id, canonical_id == paper_id
 
 
 class AcademicGraphBuilder:
     """Builds an academic knowledge graph from paper references."""
 
-    def __init__(self, uri: str, user: str, password: str, api_key: str = None):
-        self.kg = AcademicKnowledgeGraph(uri=uri, user=user, password=password)
-        self.ss_client: SemanticScholarClient = SemanticScholarClient(api_key=api_key)
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        api_key: str = None,
+        batch_size: int = 500,
+        use_cache: bool = True,
+        use_apoc: bool = False,
+        max_rate: Optional[float] = None,
+        time_period: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Args:
+            uri: Neo4j database URI
+            user: Database username
+            password: Database password
+            api_key: Semantic Scholar API key
+            batch_size: Number of papers buffered before they are written to Neo4j
+            use_cache: Whether to cache Semantic Scholar responses on disk
+            use_apoc: Write citation batches with apoc.periodic.iterate
+            max_rate: Semantic Scholar calls allowed per `time_period` (defaults
+                to the documented quota for the key in use)
+            time_period: Semantic Scholar rate limit window in seconds
+            rate_limiter: Semantic Scholar token bucket shared with other
+                clients using the same API key
+        """
+        self.kg = AcademicKnowledgeGraph(
+            uri=uri, user=user, password=password, use_apoc=use_apoc
+        )
+        self.ss_client: SemanticScholarClient = SemanticScholarClient(
+            api_key=api_key,
+            max_rate=max_rate,
+            time_period=time_period,
+            use_cache=use_cache,
+            rate_limiter=rate_limiter,
+        )
+        self.batch_size = batch_size
+
+    def _flush_writes(self, papers: List[Dict], citations: List[Tuple[str, str]]):
+        """Write buffered papers, then the citations between them, and clear both."""
+        if papers:
+            self.kg.add_papers_bulk(papers)
+            papers.clear()
+        if citations:
+            self.kg.add_citation_relationships_bulk(citations)
+            citations.clear()
+
+    async def _flush_writes_async(
+        self, papers: List[Dict], citations: List[Tuple[str, str]]
+    ):
+        """Async variant of `_flush_writes`; takes ownership of both lists."""
+        if papers:
+            await self.kg.add_papers_bulk_async(papers)
+        if citations:
+            await self.kg.add_citation_relationships_bulk_async(citations)
+
+    def fetch_papers_by_title(
+        self, titles: List[str], max_concurrency: int = 5
+    ) -> List[Optional[Dict]]:
+        """
+        Look up papers by title concurrently.
+
+        Requests are bounded by `max_concurrency` in flight and by the client's
+        rate limiter, so the wall clock scales with N / concurrency instead of N.
+
+        Args:
+            titles: Paper titles to look up
+            max_concurrency: Maximum number of in-flight requests
+
+        Returns:
+            Paper JSON (or None when not found) for each title, in input order
+        """
+        return run_sync(self._fetch_papers_by_title(titles, max_concurrency))
+
+    async def _fetch_papers_by_title(
+        self, titles: List[str], max_concurrency: int
+    ) -> List[Optional[Dict]]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(title: str) -> Optional[Dict]:
+            async with semaphore:
+                return await self.ss_client.get_paper_by_title_async(title)
+
+        try:
+            results = await asyncio.gather(
+                *(fetch(title) for title in titles), return_exceptions=True
+            )
+        finally:
+            await self.ss_client.aclose()
+
+        return [None if isinstance(r, BaseException) else r for r in results]
 
     def add_paper_with_citations(
         self,
         parent_paper: ReferenceDetails,
-        references: List[ReferenceDetails],
+        references: Iterable[ReferenceDetails],
         max_papers: int = None,
-        rate_limit_delay: float = 1.0,
+        rate_limit_delay: Optional[float] = None,
+        max_concurrency: int = 5,
     ) -> Tuple[List[ReferenceDetails], List[ReferenceDetails]]:
         """
         Add a parent paper and its citations to the knowledge graph.
@@ -30,11 +205,15 @@ class AcademicGraphBuilder:
             parent_paper: The parent paper details
             references: List of reference paper details
             max_papers: Maximum number of papers to add (None for all)
-            rate_limit_delay: Delay between API calls in seconds
+            rate_limit_delay: Deprecated and ignored. API calls are throttled by the
+                Semantic Scholar client's rate limiter, never by fixed sleeps.
+            max_concurrency: Maximum number of concurrent API lookups
 
         Returns:
             Tuple of (successful_additions, unsuccessful_additions)
         """
+        _warn_rate_limit_delay(rate_limit_delay)
+
         successful_additions = []
         unsuccessful_additions = []
 
@@ -50,26 +229,44 @@ class AcademicGraphBuilder:
                 parent_paper_json, return_paper_id=True
             )
 
-            # Add referenced papers
-            for reference in tqdm(references, mininterval=0.1, dynamic_ncols=True):
-                paper_json = self.ss_client.get_paper_by_title(reference.title)
-
-                if paper_json:
-                    paper_id = self.kg.add_paper_from_json(
-                        paper_json, return_paper_id=True
-                    )
-                    self.kg.add_citation_relationship(
-                        citing_paper_id=parent_paper_id, cited_paper_id=paper_id
-                    )
-                    successful_additions.append(reference)
-
-                    if max_papers and len(successful_additions) >= max_papers:
+            # Look up referenced papers concurrently, then write serially. With
+            # `max_papers` set, titles are resolved a window at a time so no
+            # lookups are spent once enough papers have been found
+            references = list(_unique_references(references))
+            papers_buffer, citations_buffer = [], []
+            progress = tqdm(total=len(references), mininterval=0.1, dynamic_ncols=True)
+            start = 0
+            while start < len(references):
+                window = len(references) - start
+                if max_papers:
+                    remaining = max_papers - len(successful_additions)
+                    if remaining <= 0:
                         break
-                else:
-                    tqdm.write(f"Paper not found: {reference.title}")
-                    unsuccessful_additions.append(reference)
+                    window = min(window, max(max_concurrency, 1), remaining)
+                batch = references[start : start + window]
+                start += window
+                papers_json = self.fetch_papers_by_title(
+                    [reference.title for reference in batch], max_concurrency
+                )
 
-                time.sleep(rate_limit_delay)
+                # Add referenced papers, buffering writes into UNWIND batches
+                for reference, paper_json in zip(batch, papers_json):
+                    progress.update()
+                    if paper_json and paper_json.get("paperId"):
+                        papers_buffer.append(paper_json)
+                        citations_buffer.append(
+                            (parent_paper_id, paper_json["paperId"])
+                        )
+                        successful_additions.append(reference)
+
+                        if len(papers_buffer) >= self.batch_size:
+                            self._flush_writes(papers_buffer, citations_buffer)
+                    else:
+                        tqdm.write(f"Paper not found: {reference.title}")
+                        unsuccessful_additions.append(reference)
+            progress.close()
+
+            self._flush_writes(papers_buffer, citations_buffer)
 
         finally:
             self.kg.close()
@@ -79,25 +276,33 @@ class AcademicGraphBuilder:
     def add_paper_with_citation_network(
         self,
         parent_paper: ReferenceDetails,
-        references: List[ReferenceDetails],
+        references: Iterable[ReferenceDetails],
         max_papers: int = None,
         include_citations: bool = True,
         max_citations_per_paper: int = 100,
-        rate_limit_delay: float = 1.0,
+        rate_limit_delay: Optional[float] = None,
+        max_concurrency: int = 10,
+        max_citation_concurrency: int = 5,
     ) -> Tuple[Dict[str, int], List[ReferenceDetails]]:
         """
         Add a parent paper and its references with extended citation network.
 
         For each paper added, optionally fetch and add papers that cite it,
-        creating a comprehensive citation network.
+        creating a comprehensive citation network. Title lookups, citation
+        fetches and Neo4j writes run as a streaming pipeline, so citations for
+        the first reference are fetched while later titles are still resolving.
 
         Args:
             parent_paper: The parent paper details
-            references: List of reference paper details from PDF
+            references: Reference paper details from PDF; may be a lazy iterator,
+                which is consumed as titles are resolved
             max_papers: Maximum number of papers from PDF references to add (None for all)
             include_citations: Whether to fetch and add citing papers for each paper
             max_citations_per_paper: Maximum number of citing papers to add per paper
-            rate_limit_delay: Delay between API calls in seconds
+            rate_limit_delay: Deprecated and ignored. API calls are throttled by the
+                Semantic Scholar client's rate limiter, never by fixed sleeps.
+            max_concurrency: Maximum number of concurrent reference lookups
+            max_citation_concurrency: Maximum number of concurrent citation fetches
 
         Returns:
             Tuple of (statistics_dict, unsuccessful_additions)
@@ -108,6 +313,8 @@ class AcademicGraphBuilder:
                 - total_papers: Total papers added
                 - total_relationships: Total citation relationships created
         """
+        _warn_rate_limit_delay(rate_limit_delay)
+
         stats = {
             "parent_papers": 0,
             "pdf_references": 0,
@@ -131,89 +338,194 @@ class AcademicGraphBuilder:
             stats["parent_papers"] = 1
             stats["total_papers"] = 1
 
-            # Track all paper IDs to fetch citations for
-            papers_to_process = [(parent_paper_id, "parent")]
+            registry = _PaperRegistry()
+            registry.register(parent_paper_json)
 
-            # Add referenced papers from PDF
             tqdm.write(f"\nAdding references from PDF...")
-            for reference in tqdm(
-                references, desc="PDF References", mininterval=0.1, dynamic_ncols=True
-            ):
-                paper_json = self.ss_client.get_paper_by_title(reference.title)
-
-                if paper_json:
-                    paper_id = self.kg.add_paper_from_json(
-                        paper_json, return_paper_id=True
-                    )
-                    self.kg.add_citation_relationship(
-                        citing_paper_id=parent_paper_id, cited_paper_id=paper_id
-                    )
-                    stats["pdf_references"] += 1
-                    stats["total_papers"] += 1
-                    stats["total_relationships"] += 1
-
-                    # Add to processing queue for citation fetching
-                    papers_to_process.append((paper_id, reference.title))
-
-                    if max_papers and stats["pdf_references"] >= max_papers:
-                        break
-                else:
-                    tqdm.write(f"Paper not found: {reference.title}")
-                    unsuccessful_additions.append(reference)
-
-                time.sleep(rate_limit_delay)
-
-            # Fetch and add citing papers for each paper
-            if include_citations and max_citations_per_paper > 0:
-                tqdm.write(f"\nFetching citation networks...")
-                for paper_id, paper_title in tqdm(
-                    papers_to_process,
-                    desc="Citation Networks",
-                    mininterval=0.1,
-                    dynamic_ncols=True,
-                ):
-                    citations_response = self.ss_client.get_paper_citations(
-                        paper_id=paper_id, limit=max_citations_per_paper
-                    )
-
-                    if citations_response and citations_response.get("data"):
-                        for citation_item in citations_response["data"]:
-                            citing_paper = citation_item.get("citingPaper")
-                            if citing_paper:
-                                citing_paper_id = self.kg.add_paper_from_json(
-                                    citing_paper, return_paper_id=True
-                                )
-                                self.kg.add_citation_relationship(
-                                    citing_paper_id=citing_paper_id,
-                                    cited_paper_id=paper_id,
-                                )
-                                stats["citations_added"] += 1
-                                stats["total_papers"] += 1
-                                stats["total_relationships"] += 1
-
-                            time.sleep(rate_limit_delay)
-
-                    time.sleep(rate_limit_delay)
+            # Keep a sized list when one was given, for the progress bar total;
+            # an iterator is deduplicated and consumed lazily
+            unique_references = _unique_references(references)
+            if isinstance(references, Sized):
+                unique_references = list(unique_references)
+            run_sync(
+                self._stream_citation_network(
+                    parent_paper_id=parent_paper_id,
+                    references=unique_references,
+                    registry=registry,
+                    max_papers=max_papers,
+                    include_citations=include_citations and max_citations_per_paper > 0,
+                    max_citations_per_paper=max_citations_per_paper,
+                    max_concurrency=max_concurrency,
+                    max_citation_concurrency=max_citation_concurrency,
+                    stats=stats,
+                    unsuccessful=unsuccessful_additions,
+                )
+            )
 
         finally:
             self.kg.close()
 
         return stats, unsuccessful_additions
 
+    async def _stream_citation_network(
+        self,
+        parent_paper_id: str,
+        references: Iterable[ReferenceDetails],
+        registry: _PaperRegistry,
+        max_papers: Optional[int],
+        include_citations: bool,
+        max_citations_per_paper: int,
+        max_concurrency: int,
+        max_citation_concurrency: int,
+        stats: dict,
+        unsuccessful: List[ReferenceDetails],
+    ):
+        """
+        Three-stage pipeline behind `add_paper_with_citation_network`.
+
+        Stage A resolves reference titles to papers, stage B fetches citation
+        pages for resolved papers, and `_write_worker` writes both to Neo4j.
+        Stages are connected by bounded queues for backpressure. A paper is
+        queued for writing before its ID reaches stage B, so CITES edges never
+        precede the papers they point to.
+        """
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=128)
+        citation_queue: asyncio.Queue = asyncio.Queue(maxsize=128)
+        writer = asyncio.create_task(self._write_worker(write_queue))
+        pending_titles = iter(references)
+        citation_targets = {parent_paper_id}
+        progress = tqdm(
+            total=len(references) if isinstance(references, Sized) else None,
+            desc="PDF References",
+            mininterval=0.1,
+            dynamic_ncols=True,
+        )
+
+        async def resolve_titles():
+            for reference in pending_titles:
+                if max_papers and stats["pdf_references"] >= max_papers:
+                    return
+                paper_json = await self.ss_client.get_paper_by_title_async(
+                    reference.title
+                )
+                progress.update()
+                if not paper_json or not paper_json.get("paperId"):
+                    tqdm.write(f"Paper not found: {reference.title}")
+                    unsuccessful.append(reference)
+                    continue
+                if max_papers and stats["pdf_references"] >= max_papers:
+                    return
+
+                paper_id, is_new = registry.register(paper_json)
+                stats["pdf_references"] += 1
+                stats["total_papers"] += int(is_new)
+                stats["total_relationships"] += 1
+                await _put_while_writing(
+                    write_queue,
+                    ([paper_json] if is_new else [], [(parent_paper_id, paper_id)]),
+                    writer,
+                )
+                if include_citations and paper_id not in citation_targets:
+                    citation_targets.add(paper_id)
+                    await citation_queue.put(paper_id)
+
+        async def fetch_citations():
+            while (paper_id := await citation_queue.get()) is not None:
+                citations_response = await self.ss_client.get_paper_citations_async(
+                    paper_id=paper_id, limit=max_citations_per_paper
+                )
+                new_papers, citing_ids = [], {}
+                for citation_item in (citations_response or {}).get("data") or []:
+                    citing_paper = citation_item.get("citingPaper") or {}
+                    if not citing_paper.get("paperId"):
+                        continue
+                    citing_id, is_new = registry.register(citing_paper)
+                    if is_new:
+                        new_papers.append(citing_paper)
+                    if citing_id != paper_id:
+                        citing_ids[citing_id] = None
+
+                await _put_while_writing(
+                    write_queue,
+                    (new_papers, [(citing_id, paper_id) for citing_id in citing_ids]),
+                    writer,
+                )
+                stats["citations_added"] += len(new_papers)
+                stats["total_papers"] += len(new_papers)
+                stats["total_relationships"] += len(citing_ids)
+
+        fetchers = [
+            asyncio.create_task(fetch_citations())
+            for _ in range(max_citation_concurrency if include_citations else 0)
+        ]
+        resolvers = []
+        try:
+            if include_citations:
+                await citation_queue.put(parent_paper_id)
+            resolvers = [
+                asyncio.create_task(resolve_titles()) for _ in range(max_concurrency)
+            ]
+            await asyncio.gather(*resolvers)
+            for _ in fetchers:
+                await citation_queue.put(None)
+            await asyncio.gather(*fetchers)
+        finally:
+            for task in (*resolvers, *fetchers):
+                task.cancel()
+            progress.close()
+            try:
+                await _finish_writer(write_queue, writer)
+            finally:
+                await self.ss_client.aclose()
+                await self.kg.aclose()
+
     def add_paper_with_citation_network_from_api(
         self,
         parent_paper_details: dict,
         paper_to_process: List[dict],
         include_citations: bool = True,
         max_citations_per_paper: int = 50,
-        rate_limit_delay: float = 1.0,
+        rate_limit_delay: Optional[float] = None,
         publication_year: Optional[str] = None,
+        max_concurrency: int = 10,
     ) -> Tuple[dict, List[dict]]:
         """
         Build knowledge graph using Semantic Scholar API response data.
 
+        Citation pages for all papers are fetched concurrently (bounded by
+        `max_concurrency` and the client's rate limiter) while a single writer
+        flushes the results to Neo4j in UNWIND batches.
+
+        rate_limit_delay: Deprecated and ignored. API calls are throttled by the
+            Semantic Scholar client's rate limiter, never by fixed sleeps.
         publication_year: Filter references by publication year, e.g., 2022:2023
         """
+        _warn_rate_limit_delay(rate_limit_delay)
+
+        return run_sync(
+            self.aadd_paper_with_citation_network_from_api(
+                parent_paper_details=parent_paper_details,
+                paper_to_process=paper_to_process,
+                include_citations=include_citations,
+                max_citations_per_paper=max_citations_per_paper,
+                publication_year=publication_year,
+                max_concurrency=max_concurrency,
+            )
+        )
+
+    async def aadd_paper_with_citation_network_from_api(
+        self,
+        parent_paper_details: dict,
+        paper_to_process: List[dict],
+        include_citations: bool = True,
+        max_citations_per_paper: int = 50,
+        publication_year: Optional[str] = None,
+        max_concurrency: int = 10,
+    ) -> Tuple[dict, List[dict]]:
+        """
+        Async variant of `add_paper_with_citation_network_from_api`, for callers
+        that already fetched `paper_to_process` on the running event loop.
+        """
         stats = {
             "parent_papers": 0,
             "pdf_references": 0,
@@ -228,73 +540,188 @@ class AcademicGraphBuilder:
             tqdm.write(
                 f"Adding parent paper: {parent_paper_details.get('title', 'Unknown')}"
             )
-            self.kg.add_paper_from_json(parent_paper_details)
+            await asyncio.to_thread(self.kg.add_paper_from_json, parent_paper_details)
             stats["parent_papers"] = 1
             stats["total_papers"] += 1
 
-        references_to_process = paper_to_process
+        # Deduplicate by paperId before any API or DB work, keeping the
+        # richest record when the same paper is listed more than once
+        references_by_id: Dict[str, Tuple[dict, dict]] = {}
+        for ref in paper_to_process:
+            # Note is written only for citation, not for reference, i need to alter code to support both
+            cited_paper = ref.get("citingPaper", {}) or ref.get("citedPaper", {})
+            paper_id = cited_paper.get("paperId")
+            if not paper_id:
+                unsuccessful.append(ref)
+                continue
+            kept = references_by_id.get(paper_id)
+            if kept is None or _richness(cited_paper) > _richness(kept[1]):
+                references_by_id[paper_id] = (ref, cited_paper)
+
+        # Then collapse entries whose titles only differ in case/punctuation
+        registry = _PaperRegistry()
+        if parent_paper_id:
+            registry.register(parent_paper_details)
+        references_to_process = [
+            (ref, cited_paper)
+            for ref, cited_paper in references_by_id.values()
+            if registry.register(cited_paper)[1]
+        ]
 
         tqdm.write(f"\nProcessing {len(references_to_process)} references...")
-        for ref in tqdm(
-            references_to_process,
+        await self._ingest_citation_network(
+            parent_paper_id=parent_paper_id,
+            references=references_to_process,
+            registry=registry,
+            include_citations=include_citations,
+            max_citations_per_paper=max_citations_per_paper,
+            publication_year=publication_year,
+            max_concurrency=max_concurrency,
+            stats=stats,
+            unsuccessful=unsuccessful,
+        )
+
+        tqdm.write(
+            f"\nCompleted: {stats['total_papers']} papers, {stats['total_relationships']} relationships"
+        )
+        return stats, unsuccessful
+
+    async def _ingest_citation_network(
+        self,
+        parent_paper_id: Optional[str],
+        references: List[Tuple[dict, dict]],
+        registry: _PaperRegistry,
+        include_citations: bool,
+        max_citations_per_paper: int,
+        publication_year: Optional[str],
+        max_concurrency: int,
+        stats: dict,
+        unsuccessful: List[dict],
+    ):
+        """
+        Producer/consumer pipeline behind `add_paper_with_citation_network_from_api`.
+
+        Producers fetch citation pages concurrently and put (papers, citations)
+        items on a queue; `_write_worker` drains it into Neo4j so the slowest
+        stage does not stall the others. Citing papers already seen in this
+        run (by paperId or normalised title) only contribute their edges.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=128)
+        writer = asyncio.create_task(self._write_worker(queue))
+        semaphore = asyncio.Semaphore(max_concurrency)
+        progress = tqdm(
+            total=len(references),
             desc="Adding references",
             colour="green",
             mininterval=0.1,
             dynamic_ncols=True,
-        ):
-            #Note is written only for citation, not for reference, i need to alter code to support both
-            cited_paper = ref.get("citingPaper", {}) or ref.get("citedPaper", {})
-            cited_paper_id = cited_paper.get("paperId")
+        )
+
+        async def fetch_citations(ref: dict, cited_paper_id: str):
+            async with semaphore:
+                citations = await self.ss_client.get_paper_citations_async(
+                    paper_id=cited_paper_id,
+                    limit=max_citations_per_paper,
+                    publication_year=publication_year,
+                )
+            progress.update()
 
-            if not cited_paper_id:
+            if citations is None:
+                logger.error(f"Failed to fetch citations for paper {cited_paper_id}")
                 unsuccessful.append(ref)
-                continue
+                return
+
+            # if reference needed add here reference function.
+
+            new_papers, citing_ids = [], {}
+            for citation in citations.get("data") or []:
+                citing_paper = citation.get("citingPaper") or {}
+                if not citing_paper.get("paperId"):
+                    continue
+                citing_id, is_new = registry.register(citing_paper)
+                if is_new:
+                    new_papers.append(citing_paper)
+                if citing_id != cited_paper_id:
+                    citing_ids[citing_id] = None
+
+            await _put_while_writing(
+                queue,
+                (new_papers, [(citing_id, cited_paper_id) for citing_id in citing_ids]),
+                writer,
+            )
+            stats["citations_added"] += len(new_papers)
+            stats["total_papers"] += len(new_papers)
+            stats["total_relationships"] += len(citing_ids)
 
-            try:
-                self.kg.add_paper_from_json(cited_paper)
-                self.kg.add_citation_relationship(
-                    citing_paper_id=cited_paper_id,
-                    cited_paper_id=parent_paper_id,
+        fetchers = []
+        try:
+            # Referenced papers are queued first so citing edges always find them
+            for ref, cited_paper in references:
+                await _put_while_writing(
+                    queue,
+                    ([cited_paper], [(cited_paper["paperId"], parent_paper_id)]),
+                    writer,
                 )
                 stats["pdf_references"] += 1
                 stats["total_papers"] += 1
                 stats["total_relationships"] += 1
 
-                if include_citations:
-                    time.sleep(rate_limit_delay)
-                    citations = self.ss_client.get_paper_citations(
-                        paper_id=cited_paper_id,
-                        limit=max_citations_per_paper,
-                        publication_year=publication_year,
-                    )
+            if include_citations:
+                fetchers = [
+                    asyncio.create_task(fetch_citations(ref, cited_paper["paperId"]))
+                    for ref, cited_paper in references
+                ]
+                await asyncio.gather(*fetchers)
+        finally:
+            for fetcher in fetchers:
+                fetcher.cancel()
+            progress.close()
+            try:
+                await _finish_writer(queue, writer)
+            finally:
+                await self.ss_client.aclose()
+                await self.kg.aclose()
 
-                    # if reference needed add here reference function.
-
-                    citation_data = citations.get("data") or []
-                    for citation in tqdm(
-                        citation_data,
-                        desc=f"Citations for {cited_paper_id[:8]}",
-                        colour="green",
-                        leave=False,
-                        mininterval=0.1,
-                    ):
-                        citing_paper = citation.get("citingPaper", {})
-                        citing_paper_id = citing_paper.get("paperId")
-                        if citing_paper_id:
-                            self.kg.add_paper_from_json(citing_paper)
-                            self.kg.add_citation_relationship(
-                                citing_paper_id=citing_paper_id,
-                                cited_paper_id=cited_paper_id,
-                            )
-                            stats["citations_added"] += 1
-                            stats["total_papers"] += 1
-                            stats["total_relationships"] += 1
-
-            except Exception as e:
-                logger.error(f"Failed to add paper {cited_paper_id}: {e}")
-                unsuccessful.append(ref)
+    async def _write_worker(self, queue: asyncio.Queue):
+        """
+        Drain (papers, citations) items from `queue` into Neo4j until None arrives.
 
-        tqdm.write(
-            f"\nCompleted: {stats['total_papers']} papers, {stats['total_relationships']} relationships"
-        )
-        return stats, unsuccessful
+        Batches are written with the async driver, and the next batch keeps
+        filling while the previous one commits. At most one batch is in flight
+        so CITES edges never reach Neo4j before the papers they match on.
+
+        A failed flush is raised before any further item is accepted, so the
+        task ends with that error and anything still buffered is logged as lost.
+        """
+        papers, citations = [], []
+        in_flight: Optional[asyncio.Task] = None
+        try:
+            while True:
+                if in_flight is not None and in_flight.done():
+                    in_flight.result()
+                    in_flight = None
+                if (item := await queue.get()) is None:
+                    break
+                batch_papers, batch_citations = item
+                papers.extend(batch_papers)
+                citations.extend(batch_citations)
+                if len(papers) >= self.batch_size:
+                    if in_flight is not None:
+                        await in_flight
+                    in_flight = asyncio.create_task(
+                        self._flush_writes_async(papers, citations)
+                    )
+                    papers, citations = [], []
+
+            if in_flight is not None:
+                await in_flight
+            await self._flush_writes_async(papers, citations)
+        except BaseException:
+            if in_flight is not None:
+                in_flight.cancel()
+            if papers or citations:
+                logger.error(
+                    f"Write worker stopped with {len(papers)} papers and "
+                    f"{len(citations)} citations not written to Neo4j"
+                )
+            raise
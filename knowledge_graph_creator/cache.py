@@ -0,0 +1,84 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from knowledge_graph_creator.utils import json_dumps, json_loads
+
+# Default location of the on-disk response cache, relative to the working dir
+DEFAULT_CACHE_PATH = "ss_cache.sqlite"
+
+# Default location of the on-disk LLM extraction cache
+DEFAULT_LLM_CACHE_PATH = "llm_cache.sqlite"
+
+# Cached entries are considered stale after 30 days
+DEFAULT_EXPIRE_AFTER = 86400 * 30
+
+
+class DiskCache:
+    """
+    Persistent key/value cache for JSON-serialisable responses, backed by SQLite.
+
+    Entries older than ``expire_after`` seconds are ignored and overwritten on
+    the next write. Safe to share between threads and the event loop.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        expire_after: Optional[float] = DEFAULT_EXPIRE_AFTER,
+    ):
+        """
+        Args:
+            path: SQLite database file (":memory:" for a throwaway cache)
+            expire_after: Entry lifetime in seconds (None to never expire)
+        """
+        self.path = path
+        self.expire_after = expire_after
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a cache key from a URL and its non-null query parameters."""
+        items = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+        return json.dumps([url, items], separators=(",", ":"))
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for `key`, or None when missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, created_at = row
+        age = time.time() - created_at
+        if self.expire_after is not None and age > self.expire_after:
+            return None
+        return json_loads(value)
+
+    def set(self, key: str, value: Any):
+        """Store `value` under `key`, replacing any previous entry."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, json_dumps(value), time.time()),
+            )
+
+    def clear(self):
+        """Remove every cached entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
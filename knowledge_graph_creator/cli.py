@@ -3,11 +3,12 @@ from knowledge_graph_creator.main import build_knowledge_graph
 
 
 def parse_pages(pages_str: str) -> list[int]:
-    """Parse page numbers from string (e.g., '32-42' or '32,33,34')."""
-    if "-" in pages_str:
-        start, end = map(int, pages_str.split("-"))
-        return list(range(start, end + 1))
-    return [int(p.strip()) for p in pages_str.split(",")]
+    """Parse page numbers from string (e.g., '32-42', '32,33,34' or '1,3-5,9')."""
+    pages = []
+    for part in pages_str.split(","):
+        start, _, end = part.partition("-")
+        pages.extend(range(int(start), int(end or start) + 1))
+    return pages
 
 
 @click.command()
@@ -17,12 +18,20 @@ def parse_pages(pages_str: str) -> list[int]:
 @click.option("--year", required=True, help="Publication year")
 @click.option("--venue", required=True, help="Publication venue (journal/conference)")
 @click.option(
-    "--pages", required=True, help="Reference pages (e.g., '32-42' or '32,33,34')"
+    "--pages",
+    required=True,
+    help="Reference pages (e.g., '32-42', '32,33,34' or '1,3-5,9')",
 )
 @click.option(
     "--max-papers", type=int, default=None, help="Maximum number of papers to process"
 )
-def main(pdf_path, title, authors, year, venue, pages, max_papers):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Bypass the on-disk Semantic Scholar response cache",
+)
+def main(pdf_path, title, authors, year, venue, pages, max_papers, no_cache):
     """Build academic knowledge graph from PDF papers."""
 
     reference_pages = parse_pages(pages)
@@ -35,6 +44,7 @@ def main(pdf_path, title, authors, year, venue, pages, max_papers):
         parent_venue=venue,
         reference_pages=reference_pages,
         max_papers=max_papers,
+        use_cache=not no_cache,
     )
 
 
@@ -1,7 +1,195 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from loguru import logger
-from neo4j import GraphDatabase
+from neo4j import AsyncDriver, AsyncGraphDatabase, GraphDatabase, Record
+
+# Driver settings: bound retries of transient failures and pool waits
+_DRIVER_CONFIG = {
+    "max_transaction_retry_time": 15,
+    "connection_acquisition_timeout": 60,
+}
+
+# Cypher statements are module constants so every call sends an identical
+# string, which keeps the driver and server-side query plan caches warm
+_INDEX_CYPHER = [
+    "CREATE CONSTRAINT paper_id_unique IF NOT EXISTS "
+    "FOR (p:Paper) REQUIRE p.paper_id IS UNIQUE",
+    "CREATE CONSTRAINT author_id_unique IF NOT EXISTS "
+    "FOR (a:Author) REQUIRE a.author_id IS UNIQUE",
+    "CREATE CONSTRAINT venue_id_unique IF NOT EXISTS "
+    "FOR (v:Venue) REQUIRE v.venue_id IS UNIQUE",
+    "CREATE INDEX corpus_id_idx IF NOT EXISTS FOR (p:Paper) ON (p.corpus_id)",
+]
+
+_PAPERS_BULK_CYPHER = """
+UNWIND $rows AS r
+MERGE (p:Paper {paper_id: r.paper_id})
+SET p.corpus_id = r.corpus_id,
+    p.title = r.title,
+    p.year = r.year,
+    p.venue = r.venue,
+    p.abstract = r.abstract,
+    p.url = r.url,
+    p.reference_count = r.reference_count,
+    p.citation_count = r.citation_count,
+    p.is_influential = r.is_influential,
+    p.influential_citation_count = r.influential_citation_count,
+    p.is_open_access = r.is_open_access,
+    p.publication_types = r.publication_types,
+    p.publication_date = CASE
+        WHEN r.publication_date IS NULL THEN p.publication_date
+        ELSE date(r.publication_date)
+    END,
+    p.fields_of_study = r.fields_of_study,
+    p.match_score = r.match_score,
+    p.updated_at = datetime()
+"""
+
+_AUTHORS_BULK_CYPHER = """
+UNWIND $rows AS r
+MERGE (a:Author {author_id: r.author_id})
+ON CREATE SET
+    a.name = r.name,
+    a.created_at = datetime(),
+    a.updated_at = datetime()
+ON MATCH SET
+    a.updated_at = datetime()
+WITH a, r
+MATCH (p:Paper {paper_id: r.paper_id})
+MERGE (p)-[rel:AUTHORED_BY]->(a)
+SET rel.author_order = r.author_order
+"""
+
+_VENUES_BULK_CYPHER = """
+UNWIND $rows AS r
+MERGE (v:Venue {venue_id: r.venue_id})
+SET v.name = r.name,
+    v.venue_type = r.venue_type,
+    v.alternate_names = r.alternate_names,
+    v.url = r.url,
+    v.updated_at = datetime()
+WITH v, r
+MATCH (p:Paper {paper_id: r.paper_id})
+MERGE (p)-[:PUBLISHED_IN]->(v)
+"""
+
+_CITATIONS_BULK_CYPHER = """
+UNWIND $rows AS r
+MATCH (p1:Paper {paper_id: r.citing_id})
+MATCH (p2:Paper {paper_id: r.cited_id})
+MERGE (p1)-[rel:CITES]->(p2)
+SET rel.created_at = datetime()
+RETURN r.citing_id AS citing_id, r.cited_id AS cited_id
+"""
+
+# Server-side batching for large citation sets (requires the APOC plugin).
+# Not parallel: concurrent batches MERGE-ing edges on shared papers deadlock.
+_CITATIONS_APOC_CYPHER = """
+CALL apoc.periodic.iterate(
+    'UNWIND $rows AS r RETURN r',
+    'MATCH (p1:Paper {paper_id: r.citing_id})
+     MATCH (p2:Paper {paper_id: r.cited_id})
+     MERGE (p1)-[rel:CITES]->(p2)
+     SET rel.created_at = datetime()',
+    {batchSize: $batch_size, parallel: false, params: {rows: $rows}}
+)
+YIELD batches, failedOperations, errorMessages
+RETURN batches, failedOperations, errorMessages
+"""
+
+_PAPER_MERGE_CYPHER = """
+MERGE (p:Paper {paper_id: $paper_id})
+SET p.corpus_id = $corpus_id,
+    p.title = $title,
+    p.year = $year,
+    p.venue = $venue,
+    p.abstract = $abstract,
+    p.url = $url,
+    p.reference_count = $reference_count,
+    p.citation_count = $citation_count,
+    p.is_influential = $is_influential,
+    p.influential_citation_count = $influential_citation_count,
+    p.is_open_access = $is_open_access,
+    p.publication_types = $publication_types,
+    p.publication_date = CASE
+        WHEN $publication_date IS NULL THEN p.publication_date
+        ELSE date($publication_date)
+    END,
+    p.fields_of_study = $fields_of_study,
+    p.match_score = $match_score,
+    p.updated_at = datetime()
+WITH p
+CALL {
+    WITH p
+    UNWIND $authors AS a
+    MERGE (au:Author {author_id: a.author_id})
+    ON CREATE SET
+        au.name = a.name,
+        au.created_at = datetime(),
+        au.updated_at = datetime()
+    ON MATCH SET
+        au.updated_at = datetime()
+    MERGE (p)-[r:AUTHORED_BY]->(au)
+    SET r.author_order = a.author_order
+}
+CALL {
+    WITH p
+    UNWIND $venues AS v
+    MERGE (vn:Venue {venue_id: v.venue_id})
+    SET vn.name = v.name,
+        vn.venue_type = v.venue_type,
+        vn.alternate_names = v.alternate_names,
+        vn.url = v.url,
+        vn.updated_at = datetime()
+    MERGE (p)-[:PUBLISHED_IN]->(vn)
+}
+RETURN p.paper_id as paper_id
+"""
+
+_CITATION_MERGE_CYPHER = """
+MATCH (p1:Paper {paper_id: $citing_id})
+MATCH (p2:Paper {paper_id: $cited_id})
+MERGE (p1)-[r:CITES]->(p2)
+SET r.created_at = datetime()
+RETURN count(r) AS created
+"""
+
+_PAPER_INFO_CYPHER = """
+MATCH (p:Paper {paper_id: $paper_id})
+OPTIONAL MATCH (p)-[:AUTHORED_BY]->(a:Author)
+OPTIONAL MATCH (p)-[:PUBLISHED_IN]->(v:Venue)
+RETURN p, collect(DISTINCT a) as authors, v as venue
+"""
+
+_AUTHOR_PAPERS_CYPHER = """
+MATCH (a:Author {author_id: $author_id})<-[:AUTHORED_BY]-(p:Paper)
+RETURN p
+ORDER BY p.year DESC
+"""
+
+_VENUE_PAPERS_CYPHER = """
+MATCH (v:Venue {venue_id: $venue_id})<-[:PUBLISHED_IN]-(p:Paper)
+RETURN p
+ORDER BY p.year DESC
+LIMIT $limit
+"""
+
+_COAUTHORS_CYPHER = """
+MATCH (a1:Author {author_id: $author_id})<-[:AUTHORED_BY]-(p:Paper)-[:AUTHORED_BY]->(a2:Author)
+WHERE a1 <> a2
+RETURN a2.author_id as author_id,
+       a2.name as name,
+       count(DISTINCT p) as papers_together
+ORDER BY papers_together DESC
+"""
+
+_SEARCH_PAPERS_BY_TITLE_CYPHER = """
+MATCH (p:Paper)
+WHERE toLower(p.title) CONTAINS toLower($search_term)
+RETURN p
+ORDER BY p.citation_count DESC
+LIMIT $limit
+"""
 
 
 class AcademicKnowledgeGraph:
@@ -9,7 +197,15 @@ class AcademicKnowledgeGraph:
     Build an academic knowledge graph from Semantic Scholar API responses.
     """
 
-    def __init__(self, uri: str, user: str, password: str):
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        database: str = "neo4j",
+        use_apoc: bool = False,
+        apoc_batch_size: int = 1000,
+    ):
         """
         Initialize connection to Neo4j database.
 
@@ -17,28 +213,58 @@ class AcademicKnowledgeGraph:
             uri: Neo4j database URI (e.g., 'bolt://localhost:7687')
             user: Database username
             password: Database password
+            database: Database name, set explicitly to skip the home-db lookup
+            use_apoc: Write bulk citations with apoc.periodic.iterate
+            apoc_batch_size: Rows per APOC inner transaction
         """
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
-        # self._create_indexes()
+        self.uri = uri
+        self.database = database
+        self.use_apoc = use_apoc
+        self.apoc_batch_size = apoc_batch_size
+        self._auth = (user, password)
+        self.driver = GraphDatabase.driver(uri, auth=self._auth, **_DRIVER_CONFIG)
+        self._async_driver: Optional[AsyncDriver] = None
+        # Papers and CITES edges already written by this instance, so repeated
+        # writes in a run skip the Bolt round trip
+        self._seen_paper_ids: Set[str] = set()
+        self._seen_citation_edges: Set[Tuple[str, str]] = set()
+        self._create_indexes()
 
     def close(self):
         """Close the database connection."""
         self.driver.close()
 
+    def _get_async_driver(self) -> AsyncDriver:
+        """Lazily create the async driver used by the `*_async` write methods."""
+        if self._async_driver is None:
+            self._async_driver = AsyncGraphDatabase.driver(
+                self.uri, auth=self._auth, **_DRIVER_CONFIG
+            )
+        return self._async_driver
+
+    async def aclose(self):
+        """
+        Close the async driver.
+
+        The driver is bound to the running event loop, so call this before the
+        loop started with `asyncio.run` finishes.
+        """
+        if self._async_driver is not None:
+            await self._async_driver.close()
+            self._async_driver = None
+
     def _create_indexes(self):
-        """Create indexes for better query performance."""
-        indexes = [
-            "CREATE INDEX paper_id_idx IF NOT EXISTS FOR (p:Paper) ON (p.paper_id)",
-            "CREATE INDEX author_id_idx IF NOT EXISTS FOR (a:Author) ON (a.author_id)",
-            "CREATE INDEX venue_id_idx IF NOT EXISTS FOR (v:Venue) ON (v.venue_id)",
-            "CREATE INDEX corpus_id_idx IF NOT EXISTS FOR (p:Paper) ON (p.corpus_id)",
-        ]
+        """
+        Create constraints and indexes for better query performance.
 
-        with self.driver.session() as session:
-            for index_query in indexes:
+        Uniqueness constraints back every MERGE/MATCH on the id properties with
+        an index, so lookups are O(log n) instead of a label scan.
+        """
+        with self.driver.session(database=self.database) as session:
+            for index_query in _INDEX_CYPHER:
                 try:
-                    session.run(indexes)
-                    logger.info(f"Index created/verified")
+                    session.run(index_query).consume()
+                    logger.info(f"Index created/verified: {index_query}")
                 except Exception as e:
                     logger.warning(f"Index creation warning: {e}")
 
@@ -50,65 +276,67 @@ class AcademicKnowledgeGraph:
 
         Args:
             paper_data: Dictionary containing paper information from API
+            return_paper_id: Return the paper ID instead of True on success
 
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            with self.driver.session() as session:
-                # Create paper node
-                paper_id = self._create_paper(session, paper_data)
+        paper_id = paper_data.get("paperId")
+        if paper_id in self._seen_paper_ids:
+            return paper_id if return_paper_id else True
 
-                # Create authors and link them
-                self._create_authors(session, paper_data, paper_id)
-
-                # Create venue and link it
-                if paper_data.get("publicationVenue"):
-                    self._create_venue(session, paper_data, paper_id)
+        try:
+            with self.driver.session(database=self.database) as session:
+                paper_id = session.execute_write(self._merge_paper, paper_data)
+            self._seen_paper_ids.add(paper_id)
 
-                logger.info(f"Successfully added paper: {paper_id}")
-                if return_paper_id:
-                    return paper_id
-                return True
+            logger.info(f"Successfully added paper: {paper_id}")
+            if return_paper_id:
+                return paper_id
+            return True
 
         except Exception as e:
             logger.error(f"Error adding paper {paper_data.get('paperId')}: {e}")
             return False
 
-    def _create_paper(self, session, paper_data: Dict) -> str:
-        """Create a Paper node."""
-        query = """
-        MERGE (p:Paper {paper_id: $paper_id})
-        SET p.corpus_id = $corpus_id,
-            p.title = $title,
-            p.year = $year,
-            p.venue = $venue,
-            p.abstract = $abstract,
-            p.url = $url,
-            p.reference_count = $reference_count,
-            p.citation_count = $citation_count,
-            p.is_influential = $is_influential,
-            p.influential_citation_count = $influential_citation_count,
-            p.is_open_access = $is_open_access,
-            p.publication_types = $publication_types,
-            p.publication_date = date($publication_date),
-            p.fields_of_study = $fields_of_study,
-            p.match_score = $match_score,
-            p.updated_at = datetime()
-        RETURN p.paper_id as paper_id
-        """
-
-        # Extract fields of study
-        fields_of_study = []
-        if paper_data.get("fieldsOfStudy"):
-            fields_of_study.extend(paper_data["fieldsOfStudy"])
-        if paper_data.get("s2FieldsOfStudy"):
-            fields_of_study.extend(
-                [f["category"] for f in paper_data["s2FieldsOfStudy"]]
+    def _merge_paper(self, tx, paper_data: Dict) -> str:
+        """
+        Create a Paper node with its Author and Venue nodes in one round trip.
+
+        Authors and venue are merged in unit subqueries so an empty list on one
+        side does not stop the other from being written.
+        """
+        params = self._paper_params(paper_data)
+        paper_id = params["paper_id"]
+        if not paper_data.get("authors"):
+            logger.error(f"Author Field Missing: {paper_id}")
+        venue = self._venue_params(paper_data, paper_id)
+        params["authors"] = self._author_params(paper_data, paper_id)
+        params["venues"] = [venue] if venue else []
+
+        records = list(tx.run(_PAPER_MERGE_CYPHER, params))
+        return records[0]["paper_id"]
+
+    @staticmethod
+    def _paper_params(paper_data: Dict) -> Dict:
+        """
+        Map Semantic Scholar paper JSON to Paper node properties.
+
+        Explicit nulls from the API are coerced to the same defaults as missing
+        keys so every call binds parameters of the same shape.
+        """
+        # Extract fields of study, deduplicated in a stable order so unchanged
+        # papers are not rewritten with a reordered list
+        fields_of_study = list(
+            dict.fromkeys(
+                [
+                    *(paper_data.get("fieldsOfStudy") or []),
+                    *(f["category"] for f in paper_data.get("s2FieldsOfStudy") or []),
+                ]
             )
-        fields_of_study = list(set(fields_of_study))  # Remove duplicates
+        )
 
-        params = {
+        return {
             "paper_id": paper_data["paperId"],
             "corpus_id": paper_data.get("corpusId"),
             "title": paper_data.get("title"),
@@ -116,77 +344,43 @@ class AcademicKnowledgeGraph:
             "venue": paper_data.get("venue"),
             "abstract": paper_data.get("abstract"),
             "url": paper_data.get("url"),
-            "reference_count": paper_data.get("referenceCount", 0),
-            "citation_count": paper_data.get("citationCount", 0),
-            "is_influential": paper_data.get("isInfluential", False),
-            "influential_citation_count": paper_data.get("influentialCitationCount", 0),
-            "is_open_access": paper_data.get("isOpenAccess", False),
-            "publication_types": paper_data.get("publicationTypes", []),
-            "publication_date": paper_data.get("publicationDate"),
+            "reference_count": paper_data.get("referenceCount") or 0,
+            "citation_count": paper_data.get("citationCount") or 0,
+            "is_influential": bool(paper_data.get("isInfluential")),
+            "influential_citation_count": paper_data.get("influentialCitationCount")
+            or 0,
+            "is_open_access": bool(paper_data.get("isOpenAccess")),
+            "publication_types": paper_data.get("publicationTypes") or [],
+            "publication_date": paper_data.get("publicationDate") or None,
             "fields_of_study": fields_of_study,
             "match_score": paper_data.get("matchScore"),
         }
 
-        result = session.run(query, params)
-        return result.single()["paper_id"]
-
     @staticmethod
-    def _create_authors(session, paper_data: Dict, paper_id: str):
-        """Create Author nodes and AUTHORED_BY relationships. Reuse existing author nodes."""
-        authors = paper_data.get("authors", [])
-
-        if not authors:
-            logger.error(f"Author Field Missing: {paper_id}")
-            return
-
+    def _author_params(paper_data: Dict, paper_id: str) -> List[Dict]:
+        """Map the authors of a paper JSON to AUTHORED_BY rows, in author order."""
         authors = [
             valid_author
-            for valid_author in authors
+            for valid_author in paper_data.get("authors") or []
             if valid_author.get("authorId") and valid_author.get("name")
         ]
-
-        for index, author_data in enumerate(authors):
-            # MERGE will find existing node by author_id or create new one
-            query = """
-            MERGE (a:Author {author_id: $author_id})
-            ON CREATE SET 
-                a.name = $name,
-                a.created_at = datetime(),
-                a.updated_at = datetime()
-            ON MATCH SET
-                a.updated_at = datetime()
-            WITH a
-            MATCH (p:Paper {paper_id: $paper_id})
-            MERGE (p)-[r:AUTHORED_BY]->(a)
-            SET r.author_order = $author_order
-            """
-
-            params = {
+        return [
+            {
                 "author_id": author_data["authorId"],
                 "name": author_data["name"],
                 "paper_id": paper_id,
                 "author_order": index + 1,
             }
+            for index, author_data in enumerate(authors)
+        ]
 
-            session.run(query, params)
-
-    def _create_venue(self, session, paper_data: Dict, paper_id: str):
-        """Create Venue node and PUBLISHED_IN relationship."""
-        venue_data = paper_data["publicationVenue"]
-
-        query = """
-        MERGE (v:Venue {venue_id: $venue_id})
-        SET v.name = $name,
-            v.venue_type = $venue_type,
-            v.alternate_names = $alternate_names,
-            v.url = $url,
-            v.updated_at = datetime()
-        WITH v
-        MATCH (p:Paper {paper_id: $paper_id})
-        MERGE (p)-[:PUBLISHED_IN]->(v)
-        """
-
-        params = {
+    @staticmethod
+    def _venue_params(paper_data: Dict, paper_id: str) -> Optional[Dict]:
+        """Map the publication venue of a paper JSON to a PUBLISHED_IN row."""
+        venue_data = paper_data.get("publicationVenue")
+        if not venue_data:
+            return None
+        return {
             "venue_id": venue_data["id"],
             "name": venue_data["name"],
             "venue_type": venue_data.get("type"),
@@ -195,8 +389,6 @@ class AcademicKnowledgeGraph:
             "paper_id": paper_id,
         }
 
-        session.run(query, params)
-
     def add_citation_relationship(self, citing_paper_id: str, cited_paper_id: str):
         """
         Create a CITES relationship between two papers.
@@ -205,15 +397,239 @@ class AcademicKnowledgeGraph:
             citing_paper_id: ID of the paper that cites
             cited_paper_id: ID of the paper being cited
         """
-        query = """
-        MATCH (p1:Paper {paper_id: $citing_id})
-        MATCH (p2:Paper {paper_id: $cited_id})
-        MERGE (p1)-[r:CITES]->(p2)
-        SET r.created_at = datetime()
+        edge = (citing_paper_id, cited_paper_id)
+        if edge in self._seen_citation_edges:
+            return
+
+        params = {"citing_id": citing_paper_id, "cited_id": cited_paper_id}
+        with self.driver.session(database=self.database) as session:
+            created = session.execute_write(
+                lambda tx: tx.run(_CITATION_MERGE_CYPHER, params).single()["created"]
+            )
+        # Nothing is created when either paper is missing; leave the edge
+        # unrecorded so a later call can write it once both exist
+        if created:
+            self._seen_citation_edges.add(edge)
+
+    def add_papers_bulk(self, papers: Iterable[Dict]) -> List[str]:
+        """
+        Add many papers and their authors and venues in a single transaction.
+
+        Uses one UNWIND query each for papers, authors and venues instead of
+        `1 + n_authors` round trips per paper. Papers already written by this
+        instance are skipped.
+
+        Args:
+            papers: Paper dictionaries from the Semantic Scholar API
+
+        Returns:
+            List of paper IDs written, empty if the transaction failed
+        """
+        paper_rows, author_rows, venue_rows = self._bulk_rows(papers)
+        if not paper_rows:
+            return []
+
+        try:
+            with self.driver.session(database=self.database) as session:
+                session.execute_write(
+                    self._write_papers_bulk, paper_rows, author_rows, venue_rows
+                )
+        except Exception as e:
+            logger.error(f"Error adding batch of {len(paper_rows)} papers: {e}")
+            return []
+
+        self._seen_paper_ids.update(row["paper_id"] for row in paper_rows)
+        logger.info(f"Successfully added {len(paper_rows)} papers")
+        return [row["paper_id"] for row in paper_rows]
+
+    async def add_papers_bulk_async(self, papers: Iterable[Dict]) -> List[str]:
+        """
+        Async variant of `add_papers_bulk` using the async driver.
+
+        Lets an event loop keep serving API calls while the batch is committed,
+        without handing the write to a worker thread. Unlike the sync variant, a
+        failed transaction is raised rather than reported as an empty result,
+        so a write pipeline stops instead of sending citations for papers that
+        were never written.
+
+        Raises:
+            neo4j.exceptions.Neo4jError: If the transaction fails
+        """
+        paper_rows, author_rows, venue_rows = self._bulk_rows(papers)
+        if not paper_rows:
+            return []
+
+        driver = self._get_async_driver()
+        try:
+            async with driver.session(database=self.database) as session:
+                await session.execute_write(
+                    self._write_papers_bulk_async, paper_rows, author_rows, venue_rows
+                )
+        except Exception as e:
+            logger.error(f"Error adding batch of {len(paper_rows)} papers: {e}")
+            raise
+
+        self._seen_paper_ids.update(row["paper_id"] for row in paper_rows)
+        logger.info(f"Successfully added {len(paper_rows)} papers")
+        return [row["paper_id"] for row in paper_rows]
+
+    def _bulk_rows(
+        self, papers: Iterable[Dict]
+    ) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """
+        Build the Paper, AUTHORED_BY and PUBLISHED_IN rows for a bulk write,
+        skipping papers already written or repeated within the batch.
+        """
+        paper_rows, author_rows, venue_rows = [], [], []
+        batch_ids = set()
+        for paper_data in papers:
+            if not paper_data or not paper_data.get("paperId"):
+                continue
+            paper_id = paper_data["paperId"]
+            if paper_id in self._seen_paper_ids or paper_id in batch_ids:
+                continue
+            batch_ids.add(paper_id)
+            paper_row = self._paper_params(paper_data)
+            paper_rows.append(paper_row)
+            author_rows.extend(self._author_params(paper_data, paper_row["paper_id"]))
+            venue_row = self._venue_params(paper_data, paper_row["paper_id"])
+            if venue_row:
+                venue_rows.append(venue_row)
+        return paper_rows, author_rows, venue_rows
+
+    @staticmethod
+    def _write_papers_bulk(
+        tx, paper_rows: List[Dict], author_rows: List[Dict], venue_rows: List[Dict]
+    ):
+        """Transaction function writing Paper, Author and Venue rows with UNWIND."""
+        tx.run(_PAPERS_BULK_CYPHER, rows=paper_rows)
+        if author_rows:
+            tx.run(_AUTHORS_BULK_CYPHER, rows=author_rows)
+        if venue_rows:
+            tx.run(_VENUES_BULK_CYPHER, rows=venue_rows)
+
+    @staticmethod
+    async def _write_papers_bulk_async(
+        tx, paper_rows: List[Dict], author_rows: List[Dict], venue_rows: List[Dict]
+    ):
+        """Async transaction function counterpart of `_write_papers_bulk`."""
+        await (await tx.run(_PAPERS_BULK_CYPHER, rows=paper_rows)).consume()
+        if author_rows:
+            await (await tx.run(_AUTHORS_BULK_CYPHER, rows=author_rows)).consume()
+        if venue_rows:
+            await (await tx.run(_VENUES_BULK_CYPHER, rows=venue_rows)).consume()
+
+    def add_citation_relationships_bulk(
+        self, citations: Iterable[Tuple[str, str]]
+    ) -> int:
+        """
+        Create many CITES relationships with a single UNWIND query.
+
+        Both papers of each pair must already exist in the graph. With
+        `use_apoc`, the rows are batched server-side by apoc.periodic.iterate.
+
+        Args:
+            citations: (citing_paper_id, cited_paper_id) pairs
+
+        Returns:
+            Number of relationships submitted, 0 if the transaction failed
         """
+        rows = self._citation_rows(citations)
+        if not rows:
+            return 0
+
+        try:
+            with self.driver.session(database=self.database) as session:
+                if self.use_apoc:
+                    # periodic.iterate manages its own transactions, so it
+                    # has to run in an auto-commit transaction
+                    record = session.run(
+                        _CITATIONS_APOC_CYPHER,
+                        rows=rows,
+                        batch_size=self.apoc_batch_size,
+                    ).single()
+                    self._check_apoc_result(record, len(rows))
+                    # APOC does not report which rows matched both papers, so
+                    # none are recorded; re-sending an edge only re-MERGEs it
+                    created = []
+                else:
+                    created = session.execute_write(
+                        lambda tx: [
+                            (record["citing_id"], record["cited_id"])
+                            for record in tx.run(_CITATIONS_BULK_CYPHER, rows=rows)
+                        ]
+                    )
+        except Exception as e:
+            logger.error(f"Error adding batch of {len(rows)} citations: {e}")
+            return 0
 
-        with self.driver.session() as session:
-            session.run(query, citing_id=citing_paper_id, cited_id=cited_paper_id)
+        self._seen_citation_edges.update(created)
+        return len(rows)
+
+    async def add_citation_relationships_bulk_async(
+        self, citations: Iterable[Tuple[str, str]]
+    ) -> int:
+        """
+        Async variant of `add_citation_relationships_bulk`.
+
+        Failed transactions and APOC batches are raised, as in
+        `add_papers_bulk_async`.
+
+        Raises:
+            neo4j.exceptions.Neo4jError: If the transaction fails
+            RuntimeError: If apoc.periodic.iterate reports failed operations
+        """
+        rows = self._citation_rows(citations)
+        if not rows:
+            return 0
+
+        async def write(tx):
+            result = await tx.run(_CITATIONS_BULK_CYPHER, rows=rows)
+            return [
+                (record["citing_id"], record["cited_id"]) async for record in result
+            ]
+
+        driver = self._get_async_driver()
+        try:
+            async with driver.session(database=self.database) as session:
+                if self.use_apoc:
+                    result = await session.run(
+                        _CITATIONS_APOC_CYPHER,
+                        rows=rows,
+                        batch_size=self.apoc_batch_size,
+                    )
+                    self._check_apoc_result(await result.single(), len(rows))
+                    created = []
+                else:
+                    created = await session.execute_write(write)
+        except Exception as e:
+            logger.error(f"Error adding batch of {len(rows)} citations: {e}")
+            raise
+
+        self._seen_citation_edges.update(created)
+        return len(rows)
+
+    @staticmethod
+    def _check_apoc_result(record: Optional[Record], row_count: int):
+        """Raise if apoc.periodic.iterate reports failed operations."""
+        if record and record["failedOperations"]:
+            raise RuntimeError(
+                f"{record['failedOperations']} of {row_count} citation writes "
+                f"failed: {record['errorMessages']}"
+            )
+
+    def _citation_rows(self, citations: Iterable[Tuple[str, str]]) -> List[Dict]:
+        """Build CITES rows, skipping incomplete, repeated or already written pairs."""
+        edges = dict.fromkeys(
+            (citing_id, cited_id)
+            for citing_id, cited_id in citations
+            if citing_id and cited_id
+        )
+        return [
+            {"citing_id": citing_id, "cited_id": cited_id}
+            for citing_id, cited_id in edges
+            if (citing_id, cited_id) not in self._seen_citation_edges
+        ]
 
     def get_paper_info(self, paper_id: str) -> Optional[Dict]:
         """
@@ -225,15 +641,8 @@ class AcademicKnowledgeGraph:
         Returns:
             Dictionary containing paper info or None if not found
         """
-        query = """
-        MATCH (p:Paper {paper_id: $paper_id})
-        OPTIONAL MATCH (p)-[:AUTHORED_BY]->(a:Author)
-        OPTIONAL MATCH (p)-[:PUBLISHED_IN]->(v:Venue)
-        RETURN p, collect(DISTINCT a) as authors, v as venue
-        """
-
-        with self.driver.session() as session:
-            result = session.run(query, paper_id=paper_id)
+        with self.driver.session(database=self.database) as session:
+            result = session.run(_PAPER_INFO_CYPHER, paper_id=paper_id)
             record = result.single()
 
             if record:
@@ -253,14 +662,8 @@ class AcademicKnowledgeGraph:
         Returns:
             List of paper dictionaries
         """
-        query = """
-        MATCH (a:Author {author_id: $author_id})<-[:AUTHORED_BY]-(p:Paper)
-        RETURN p
-        ORDER BY p.year DESC
-        """
-
-        with self.driver.session() as session:
-            result = session.run(query, author_id=author_id)
+        with self.driver.session(database=self.database) as session:
+            result = session.run(_AUTHOR_PAPERS_CYPHER, author_id=author_id)
             return [dict(record["p"]) for record in result]
 
     def get_venue_papers(self, venue_id: str, limit: int = 100) -> List[Dict]:
@@ -274,15 +677,8 @@ class AcademicKnowledgeGraph:
         Returns:
             List of paper dictionaries
         """
-        query = """
-        MATCH (v:Venue {venue_id: $venue_id})<-[:PUBLISHED_IN]-(p:Paper)
-        RETURN p
-        ORDER BY p.year DESC
-        LIMIT $limit
-        """
-
-        with self.driver.session() as session:
-            result = session.run(query, venue_id=venue_id, limit=limit)
+        with self.driver.session(database=self.database) as session:
+            result = session.run(_VENUE_PAPERS_CYPHER, venue_id=venue_id, limit=limit)
             return [dict(record["p"]) for record in result]
 
     def get_coauthors(self, author_id: str) -> List[Dict]:
@@ -295,17 +691,8 @@ class AcademicKnowledgeGraph:
         Returns:
             List of dictionaries with co-author info and collaboration count
         """
-        query = """
-        MATCH (a1:Author {author_id: $author_id})<-[:AUTHORED_BY]-(p:Paper)-[:AUTHORED_BY]->(a2:Author)
-        WHERE a1 <> a2
-        RETURN a2.author_id as author_id,
-               a2.name as name,
-               count(DISTINCT p) as papers_together
-        ORDER BY papers_together DESC
-        """
-
-        with self.driver.session() as session:
-            result = session.run(query, author_id=author_id)
+        with self.driver.session(database=self.database) as session:
+            result = session.run(_COAUTHORS_CYPHER, author_id=author_id)
             return [dict(record) for record in result]
 
     def search_papers_by_title(self, search_term: str, limit: int = 10) -> List[Dict]:
@@ -319,14 +706,8 @@ class AcademicKnowledgeGraph:
         Returns:
             List of paper dictionaries
         """
-        query = """
-        MATCH (p:Paper)
-        WHERE toLower(p.title) CONTAINS toLower($search_term)
-        RETURN p
-        ORDER BY p.citation_count DESC
-        LIMIT $limit
-        """
-
-        with self.driver.session() as session:
-            result = session.run(query, search_term=search_term, limit=limit)
+        with self.driver.session(database=self.database) as session:
+            result = session.run(
+                _SEARCH_PAPERS_BY_TITLE_CYPHER, search_term=search_term, limit=limit
+            )
             return [dict(record["p"]) for record in result]
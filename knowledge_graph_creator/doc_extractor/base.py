@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 
 
 class PDFReader(ABC):
@@ -10,3 +10,7 @@ class PDFReader(ABC):
     @abstractmethod
     def to_list(self, path: str, select_pages: List[int]) -> List[str]:
         pass
+
+    def iter_pages(self, path: str, select_pages: List[int]) -> Iterator[str]:
+        """Yield the text of each selected page; readers may override to stream."""
+        yield from self.to_list(path, select_pages)
@@ -1,8 +1,27 @@
-from typing import List
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional
 
 import pymupdf
 
 from knowledge_graph_creator.doc_extractor.base import PDFReader
+from knowledge_graph_creator.utils import chunked
+
+# Plain-text extraction flags, resolved once instead of per page
+_TEXT_FLAGS = pymupdf.TEXTFLAGS_TEXT
+
+# Below this many pages, process start-up costs more than it saves
+MIN_PAGES_FOR_PARALLEL = 8
+
+
+def _extract_pages_text(path: str, page_numbers: List[int]) -> List[str]:
+    """Worker: open the PDF independently and extract the given pages in order."""
+    with pymupdf.open(path) as doc:
+        return [
+            doc[number].get_text("text", flags=_TEXT_FLAGS) for number in page_numbers
+        ]
 
 
 class PyMuPDFReader(PDFReader):
@@ -14,20 +33,92 @@ class PyMuPDFReader(PDFReader):
         :return: Extracted text as a single string.
         """
 
-        doc = pymupdf.open(path)
-        return "\n".join(page.get_text() for page in doc)
+        buffer = io.StringIO()
+        with pymupdf.open(path) as doc:
+            for page_number, page in enumerate(doc):
+                if page_number:
+                    buffer.write("\n")
+                buffer.write(page.get_text("text", flags=_TEXT_FLAGS))
+        return buffer.getvalue()
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        :param max_workers: Processes used by to_list (defaults to the CPU count).
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
 
     def to_list(self, path: str, select_pages: List[int]) -> List[str]:
         """
         Extract text from a PDF file and return it as a list of strings, each representing a page.
+
+        Extraction is CPU-bound, so documents with at least MIN_PAGES_FOR_PARALLEL
+        selected pages are split into contiguous page ranges handled by a process pool.
         :param path:
         :param select_pages: List of page numbers to extract. If None, all pages are extracted.
         :return: List of strings, each string is the text of a page.
         """
 
-        doc = pymupdf.open(path)
+        with self.open(path) as doc:
+            select_pages = self._resolve_pages(path, select_pages, doc)
+            if len(select_pages) < MIN_PAGES_FOR_PARALLEL or self.max_workers < 2:
+                return list(self.extract_pages(doc, select_pages))
+
+        chunk_size = math.ceil(len(select_pages) / self.max_workers)
+        page_chunks = list(chunked(select_pages, chunk_size))
+        with ProcessPoolExecutor(max_workers=len(page_chunks)) as executor:
+            results = executor.map(
+                _extract_pages_text, [path] * len(page_chunks), page_chunks
+            )
+            return [text for chunk_texts in results for text in chunk_texts]
+
+    def iter_pages(self, path: str, select_pages: List[int]) -> Iterator[str]:
+        """
+        Lazily yield the text of each selected page, in order.
+
+        Only the current page's text is held at a time, so callers that process
+        pages one by one never keep the whole selection in memory.
+        :param path:
+        :param select_pages: Page numbers to extract. If None, all pages are extracted.
+        :return: Iterator of strings, each string is the text of a page.
+        """
+        with self.open(path) as doc:
+            yield from self.extract_pages(doc, select_pages)
+
+    @staticmethod
+    def open(path: str) -> pymupdf.Document:
+        """
+        Open a PDF once for several extractions; use it as a context manager.
+
+        Callers that need more than one pass over the same file (e.g. the
+        reference pages and later the title page) keep the handle and call
+        `extract_pages` on it instead of re-parsing the document each time.
+        :param path:
+        :return: The opened document.
+        """
+        return pymupdf.open(path)
+
+    def extract_pages(
+        self, doc: pymupdf.Document, select_pages: List[int]
+    ) -> Iterator[str]:
+        """
+        Lazily yield the text of each selected page of an already opened document.
+        :param doc: Document returned by `open`.
+        :param select_pages: Page numbers to extract. If None, all pages are extracted.
+        :return: Iterator of strings, each string is the text of a page.
+        """
+        for number in self._resolve_pages(doc.name, select_pages, doc):
+            yield doc[number].get_text("text", flags=_TEXT_FLAGS)
+
+    @staticmethod
+    def _resolve_pages(
+        path: str, select_pages, doc: Optional[pymupdf.Document] = None
+    ) -> List[int]:
+        """Normalise `select_pages` (int, iterable or None) to a list of pages."""
+        if isinstance(select_pages, int):
+            return [select_pages]
         if select_pages:
-            if isinstance(select_pages, int):
-                select_pages = [select_pages]
-            doc.select(select_pages)
-        return [page.get_text() for page in doc]
+            return list(select_pages)
+        if doc is not None:
+            return list(range(doc.page_count))
+        with pymupdf.open(path) as doc:
+            return list(range(doc.page_count))
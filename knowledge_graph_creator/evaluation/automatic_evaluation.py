@@ -1,76 +1,72 @@
-from neo4j import GraphDatabase
-import networkx as nx
+from neo4j import GraphDatabase, RoutingControl
 
+# Every metric is a single read query, so they go through `execute_query`
+# (pooled connection, no explicit session) against this database
+DEFAULT_DATABASE = "neo4j"
 
-# 1. Graph Topology Metrics
-def compute_graph_metrics(driver):
-    with driver.session() as session:
-        # Total nodes and edges
-        result = session.run(
-            """
-            MATCH (n:Paper)
-            RETURN count(n) as nodes
-        """
-        )
-        nodes = result.single()["nodes"]
 
-        result = session.run(
-            """
-            MATCH ()-[r]->()
-            RETURN count(r) as edges
+# 1. Graph Topology Metrics
+def compute_graph_metrics(driver, database: str = DEFAULT_DATABASE):
+    # Both counts come from the count store; degree and density are derived
+    # in the same query
+    records, _, _ = driver.execute_query(
         """
-        )
-        edges = result.single()["edges"]
-
-        # Average degree
-        avg_degree = (2 * edges) / nodes
-
-        # Density
-        density = (2 * edges) / (nodes * (nodes - 1))
-
-        return {
-            "nodes": nodes,
-            "edges": edges,
-            "avg_degree": avg_degree,
-            "density": density,
-        }
+        CALL { MATCH (n:Paper) RETURN count(n) AS nodes }
+        CALL { MATCH ()-[r]->() RETURN count(r) AS edges }
+        RETURN nodes,
+               edges,
+               CASE WHEN nodes > 0 THEN 2.0 * edges / nodes ELSE 0.0 END
+                   AS avg_degree,
+               CASE WHEN nodes > 1
+                   THEN 2.0 * edges / (nodes * (nodes - 1))
+                   ELSE 0.0
+               END AS density
+        """,
+        database_=database,
+        routing_=RoutingControl.READ,
+    )
+    return records[0].data()
 
 
 # 2. Citation Coverage Check
-def check_citation_coverage(driver):
-    with driver.session() as session:
-        result = session.run(
-            """
-            MATCH (a:Paper)-[r]->(b:Paper)
-            WHERE NOT EXISTS((a)-[:CITES]->(b))
-            RETURN count(r) as orphan_rels,
-                   count(r) * 1.0 / size([(a)-[r2]->(b2) | r2]) as orphan_ratio
+def check_citation_coverage(driver, database: str = DEFAULT_DATABASE):
+    # The total is counted once up front instead of a pattern comprehension
+    # per matched relationship
+    records, _, _ = driver.execute_query(
         """
-        )
-        return result.single()
+        MATCH ()-[r]->()
+        WITH count(r) AS total
+        OPTIONAL MATCH (a:Paper)-[r]->(b:Paper)
+        WHERE NOT EXISTS { (a)-[:CITES]->(b) }
+        WITH total, count(r) AS orphan_rels
+        RETURN orphan_rels,
+               CASE WHEN total > 0 THEN orphan_rels * 1.0 / total ELSE 0.0 END
+                   AS orphan_ratio
+        """,
+        database_=database,
+        routing_=RoutingControl.READ,
+    )
+    return records[0]
 
 
 # 3. Temporal Consistency
-def check_temporal_consistency(driver):
-    with driver.session() as session:
-        # Papers should not cite future papers
-        result = session.run(
-            """
+def check_temporal_consistency(driver, database: str = DEFAULT_DATABASE):
+    # Papers should not cite future papers
+    records, _, _ = driver.execute_query(
+        """
+        CALL {
             MATCH (a:Paper)-[r:CITES]->(b:Paper)
             WHERE a.year > b.year
-            RETURN count(r) as violations
-        """
-        )
-        violations = result.single()["violations"]
-
-        total = session.run(
-            """
-            MATCH ()-[r]->()
-            RETURN count(r) as total
-        """
-        ).single()["total"]
-
-        return 1 - (violations / total)
+            RETURN count(r) AS violations
+        }
+        CALL { MATCH ()-[r]->() RETURN count(r) AS total }
+        RETURN CASE WHEN total > 0 THEN 1.0 - violations * 1.0 / total ELSE 1.0 END
+            AS score
+        """,
+        database_=database,
+        routing_=RoutingControl.READ,
+    )
+    return records[0]["score"]
 
 
 if __name__ == "__main__":
@@ -79,4 +75,3 @@ if __name__ == "__main__":
     )
     print(check_temporal_consistency(driver))
     # print(check_citation_coverage(driver))
-    print(check_temporal_consistency(driver))
@@ -4,54 +4,121 @@ Evaluates graph quality using intrinsic metrics
 Integrated with Neo4j graph fetching
 """
 
-from collections import defaultdict, Counter
-from typing import Dict, List, Set, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Any, Optional, Tuple
 import math
-from neo4j import GraphDatabase
+
+import numpy as np
+import pandas as pd
+from neo4j import GraphDatabase, RoutingControl
+
+
+def build_csr(
+    source_idx: np.ndarray, target_idx: np.ndarray, num_nodes: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build a compressed sparse row adjacency from integer-encoded edges.
+
+    Args:
+        source_idx: Source node index of every edge
+        target_idx: Target node index of every edge
+        num_nodes: Number of nodes; indices must lie in [0, num_nodes)
+
+    Returns:
+        (indptr, indices) as int32 arrays: the targets of node i are
+        indices[indptr[i]:indptr[i + 1]], so np.diff(indptr) is the out-degree
+    """
+    indptr = np.zeros(num_nodes + 1, dtype=np.int32)
+    np.cumsum(np.bincount(source_idx, minlength=num_nodes), out=indptr[1:])
+    order = np.argsort(source_idx, kind="stable")
+    indices = np.asarray(target_idx, dtype=np.int32)[order]
+    return indptr, indices
 
 
 class Neo4jGraphFetcher:
     """Fetch knowledge graph from Neo4j database."""
 
-    def __init__(self, uri: str, user: str, password: str):
+    def __init__(self, uri: str, user: str, password: str, database: str = "neo4j"):
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        self.database = database
 
     def close(self):
         self.driver.close()
 
     def fetch_graph(self, limit: Optional[int] = None) -> Dict[str, Any]:
-        """Fetch nodes and edges from Neo4j."""
-        with self.driver.session() as session:
-            edge_query = """
+        """
+        Fetch nodes and edges from Neo4j.
+
+        Edges and node IDs are aggregated server-side in one query, so the
+        whole graph comes back as a single record in one round trip. Queries go
+        through `driver.execute_query`, which reuses pooled connections instead
+        of opening a session per call.
+        """
+        limit_clause = "LIMIT $limit" if limit else ""
+        query = f"""
+        CALL {{
             MATCH (source)-[r]->(target)
-            RETURN source.id AS source, target.id AS target,
-                   type(r) AS rel_type, r.category AS category
-            """
-            if limit:
-                edge_query += f" LIMIT {limit}"
-
-            edges = []
-            result = session.run(edge_query)
-            for record in result:
-                edges.append(
-                    {
-                        "source": record["source"],
-                        "target": record["target"],
-                        "category": record.get("category", "unknown"),
-                        "type": record.get("rel_type", "unknown"),
-                    }
-                )
-
-            node_query = "MATCH (n) RETURN n.id AS id"
-            if limit:
-                node_query += f" LIMIT {limit}"
-
-            nodes = set()
-            result = session.run(node_query)
-            for record in result:
-                nodes.add(record["id"])
-
-            return {"nodes": nodes, "edges": edges}
+            WITH source, r, target {limit_clause}
+            RETURN collect({{
+                source: source.id,
+                target: target.id,
+                category: r.category,
+                type: type(r)
+            }}) AS edges
+        }}
+        CALL {{
+            MATCH (n)
+            WITH n {limit_clause}
+            RETURN collect(n.id) AS nodes
+        }}
+        RETURN edges, nodes
+        """
+
+        records, _, _ = self.driver.execute_query(
+            query,
+            limit=limit,
+            database_=self.database,
+            routing_=RoutingControl.READ,
+        )
+        record = records[0]
+
+        return {"nodes": set(record["nodes"]), "edges": record["edges"]}
+
+    def fetch_degree_stats(self) -> Dict[str, Any]:
+        """
+        Compute node degree statistics for the whole graph inside Neo4j.
+
+        Degrees come from per-node relationship counts in a single O(V + E)
+        pass, so no edges have to be shipped to Python. The node count comes
+        from the same MATCH, so `isolated` never exceeds it; counting the
+        fetched `n.id` values instead would skip nodes without an `id`
+        property (e.g. Paper nodes, keyed by `paper_id`).
+        """
+        query = """
+        MATCH (n)
+        WITH n, COUNT { (n)-->() } AS out_degree, COUNT { (n)<--() } AS in_degree
+        RETURN count(n) AS num_nodes,
+               avg(out_degree) AS avg_out,
+               avg(in_degree) AS avg_in,
+               max(out_degree) AS max_out,
+               max(in_degree) AS max_in,
+               sum(CASE WHEN out_degree = 0 AND in_degree = 0 THEN 1 ELSE 0 END)
+                   AS isolated
+        """
+
+        records, _, _ = self.driver.execute_query(
+            query, database_=self.database, routing_=RoutingControl.READ
+        )
+        record = records[0]
+
+        return {
+            "num_nodes": record["num_nodes"] or 0,
+            "avg_out": record["avg_out"] or 0,
+            "avg_in": record["avg_in"] or 0,
+            "max_out": record["max_out"] or 0,
+            "max_in": record["max_in"] or 0,
+            "isolated": record["isolated"] or 0,
+        }
 
 
 class KnowledgeGraphEvaluator:
@@ -110,6 +177,8 @@ class KnowledgeGraphEvaluator:
             graph: Pre-loaded graph dict with 'nodes' and 'edges'
             neo4j_config: Dict with 'uri', 'user', 'password' for Neo4j connection
         """
+        # Degree stats computed by Neo4j; only valid for a full (unlimited) fetch
+        self._degree_stats: Optional[Dict[str, Any]] = None
         if neo4j_config:
             fetcher = Neo4jGraphFetcher(
                 uri=neo4j_config["uri"],
@@ -118,6 +187,8 @@ class KnowledgeGraphEvaluator:
             )
             try:
                 self.graph = fetcher.fetch_graph(neo4j_config.get("limit"))
+                if not neo4j_config.get("limit"):
+                    self._degree_stats = fetcher.fetch_degree_stats()
             finally:
                 fetcher.close()
         elif graph:
@@ -129,18 +200,44 @@ class KnowledgeGraphEvaluator:
         self.nodes = self.graph.get("nodes", set())
         self._extract_nodes_from_edges()
         self.all_types = self.TAXONOMY["semantic"] + self.TAXONOMY["referential"]
+        self._all_types_set = frozenset(self.all_types)
+
+        # Columnar copy of the edges so the metrics run as vectorised pandas
+        # operations instead of Python loops over edge dicts
+        self._edge_df = pd.DataFrame(
+            {
+                "source": self._edge_sources,
+                "target": self._edge_targets,
+                "type": self._edge_types,
+            },
+            dtype=object,
+        )
+        self._is_taxonomy_type = self._edge_df["type"].isin(self._all_types_set)
 
     def _extract_nodes_from_edges(self):
-        """Extract nodes from edges if not provided."""
+        """
+        Split the edges into source, target and type columns in a single pass,
+        and extract nodes from them if not provided.
+        """
+        self._edge_sources: List[Any] = []
+        self._edge_targets: List[Any] = []
+        self._edge_types: List[Any] = []
+        for e in self.edges:
+            self._edge_sources.append(e["source"])
+            self._edge_targets.append(e["target"])
+            self._edge_types.append(e.get("type", "unknown"))
+
         if not self.nodes:
-            self.nodes = set()
-            for e in self.edges:
-                self.nodes.add(e["source"])
-                self.nodes.add(e["target"])
+            self.nodes = set(self._edge_sources) | set(self._edge_targets)
+
+    def _type_counts(self) -> Dict[Any, int]:
+        """Count edges per relationship type, in order of first appearance."""
+        counts = self._edge_df["type"].value_counts(sort=False, dropna=False)
+        return {edge_type: int(count) for edge_type, count in counts.items()}
 
     def calculate_identification_distribution(self) -> Dict[str, Any]:
         """Analyze relationship type distribution across semantic categories."""
-        type_counts = Counter(e.get("type", "unknown") for e in self.edges)
+        type_counts = self._type_counts()
         total = len(self.edges) if self.edges else 1
 
         # Group by newcomer benefit categories
@@ -162,7 +259,7 @@ class KnowledgeGraphEvaluator:
         balance_score = 1 - (max(values) - min(values)) if values else 0
 
         return {
-            "type_counts": dict(type_counts),
+            "type_counts": type_counts,
             "benefit_group_distribution": group_distribution,
             "balance_score": balance_score,
             "total_edges": len(self.edges),
@@ -170,11 +267,11 @@ class KnowledgeGraphEvaluator:
 
     def calculate_type_classification_quality(self) -> Dict[str, Any]:
         """Evaluate 10-type taxonomy coverage and distribution."""
-        type_counts = Counter(e.get("type", "unknown") for e in self.edges)
+        type_counts = self._type_counts()
         total = len(self.edges) if self.edges else 1
 
         # Coverage: proportion of taxonomy types used
-        types_used = set(type_counts.keys()) & set(self.all_types)
+        types_used = type_counts.keys() & self._all_types_set
         coverage = len(types_used) / len(self.all_types) if self.all_types else 0
 
         # Entropy: higher = more diverse type distribution
@@ -189,11 +286,11 @@ class KnowledgeGraphEvaluator:
             normalized_entropy = 0
 
         # Validate types against taxonomy
-        valid_edges = sum(1 for e in self.edges if e.get("type") in self.all_types)
+        valid_edges = int(self._is_taxonomy_type.sum())
         validity_rate = valid_edges / total if total > 0 else 0
 
         # Unknown/invalid types detected
-        invalid_types = set(type_counts.keys()) - set(self.all_types)
+        invalid_types = type_counts.keys() - self._all_types_set
 
         return {
             "type_distribution": {
@@ -212,20 +309,51 @@ class KnowledgeGraphEvaluator:
         """Analyze graph structure and connectivity."""
         num_nodes = len(self.nodes)
         num_edges = len(self.edges)
+        if self._degree_stats is not None:
+            # Count the nodes the degree stats were computed over
+            num_nodes = self._degree_stats["num_nodes"]
 
         max_edges = num_nodes * (num_nodes - 1) if num_nodes > 1 else 1
         density = num_edges / max_edges if max_edges > 0 else 0
 
-        out_degree = Counter(e["source"] for e in self.edges)
-        in_degree = Counter(e["target"] for e in self.edges)
-
-        avg_out = sum(out_degree.values()) / num_nodes if num_nodes > 0 else 0
-        avg_in = sum(in_degree.values()) / num_nodes if num_nodes > 0 else 0
-
-        connected_nodes = set(out_degree.keys()) | set(in_degree.keys())
-        isolated = num_nodes - len(connected_nodes)
-
-        annotated = sum(1 for e in self.edges if e.get("type") in self.all_types)
+        if self._degree_stats is not None:
+            avg_out = self._degree_stats["avg_out"]
+            avg_in = self._degree_stats["avg_in"]
+            max_out = self._degree_stats["max_out"]
+            max_in = self._degree_stats["max_in"]
+            isolated = self._degree_stats["isolated"]
+            connected_count = num_nodes - isolated
+        else:
+            # Encode node ids as contiguous integers: listed nodes first, then
+            # any edge endpoints missing from the node set
+            codes, uniques = pd.factorize(
+                np.concatenate(
+                    [
+                        np.array(list(self.nodes), dtype=object),
+                        self._edge_df["source"].to_numpy(),
+                        self._edge_df["target"].to_numpy(),
+                    ]
+                ),
+                use_na_sentinel=False,
+            )
+            source_idx = codes[num_nodes : num_nodes + num_edges]
+            target_idx = codes[num_nodes + num_edges :]
+            indptr, indices = build_csr(source_idx, target_idx, len(uniques))
+            out_degree = np.diff(indptr)
+            in_degree = np.bincount(indices, minlength=len(uniques))
+
+            # Every edge adds one to both degree sums
+            avg_out = num_edges / num_nodes if num_nodes > 0 else 0
+            avg_in = num_edges / num_nodes if num_nodes > 0 else 0
+            max_out = int(out_degree.max()) if num_edges else 0
+            max_in = int(in_degree.max()) if num_edges else 0
+
+            # Every edge endpoint counts as connected, including endpoints
+            # missing from the node set
+            connected_count = int(np.count_nonzero(out_degree + in_degree))
+            isolated = num_nodes - connected_count
+
+        annotated = int(self._is_taxonomy_type.sum())
         annotation_rate = annotated / num_edges if num_edges > 0 else 0
 
         return {
@@ -234,25 +362,25 @@ class KnowledgeGraphEvaluator:
             "density": density,
             "avg_out_degree": avg_out,
             "avg_in_degree": avg_in,
-            "max_out_degree": max(out_degree.values()) if out_degree else 0,
-            "max_in_degree": max(in_degree.values()) if in_degree else 0,
+            "max_out_degree": max_out,
+            "max_in_degree": max_in,
             "isolated_nodes": isolated,
-            "connectivity_rate": (
-                len(connected_nodes) / num_nodes if num_nodes > 0 else 0
-            ),
+            "connectivity_rate": connected_count / num_nodes if num_nodes > 0 else 0,
             "annotation_completeness": annotation_rate,
         }
 
     def calculate_relationship_precision_heuristics(self) -> Dict[str, Any]:
         """Heuristic checks for relationship identification quality."""
-        self_loops = sum(1 for e in self.edges if e["source"] == e["target"])
+        df = self._edge_df
+        self_loops = int((df["source"] == df["target"]).sum())
 
-        edge_tuples = [(e["source"], e["target"], e.get("type")) for e in self.edges]
-        duplicates = len(edge_tuples) - len(set(edge_tuples))
+        typed_pairs = df.drop_duplicates(["source", "target", "type"])
+        duplicates = len(df) - len(typed_pairs)
 
-        edge_pairs = defaultdict(list)
-        for e in self.edges:
-            edge_pairs[(e["source"], e["target"])].append(e.get("type"))
+        def pairs_of_type(edge_type: str) -> pd.DataFrame:
+            return typed_pairs.loc[
+                typed_pairs["type"] == edge_type, ["source", "target"]
+            ]
 
         # Check for semantically contradictory relations on same edge
         contradictory_pairs = [
@@ -260,21 +388,23 @@ class KnowledgeGraphEvaluator:
             ("Outperforms", "Requires"),
             ("Extends", "Contradicts"),
         ]
-        semantic_conflicts = 0
-        for (src, tgt), types in edge_pairs.items():
-            type_set = set(types)
-            for t1, t2 in contradictory_pairs:
-                if t1 in type_set and t2 in type_set:
-                    semantic_conflicts += 1
-
-        # Bidirectional asymmetric check (Extends, Outperforms should be one-way)
+        semantic_conflicts = sum(
+            len(pairs_of_type(t1).merge(pairs_of_type(t2), on=["source", "target"]))
+            for t1, t2 in contradictory_pairs
+        )
+
+        # Bidirectional asymmetric check (Extends, Outperforms should be one-way):
+        # mask the column arrays once per type and intersect the pair set with
+        # its reverse
+        sources = df["source"].to_numpy()
+        targets = df["target"].to_numpy()
+        types = df["type"].to_numpy()
         asymmetric_types = ["Extends", "Outperforms", "Validates", "Enables"]
         asymmetric_violations = 0
-        for (src, tgt), types in edge_pairs.items():
-            reverse_types = edge_pairs.get((tgt, src), [])
-            for t in asymmetric_types:
-                if t in types and t in reverse_types:
-                    asymmetric_violations += 1
+        for t in asymmetric_types:
+            mask = types == t
+            pairs = set(zip(sources[mask], targets[mask]))
+            asymmetric_violations += len(pairs & {(tgt, src) for src, tgt in pairs})
 
         total = max(1, len(self.edges))
         quality_score = 1.0
@@ -293,13 +423,21 @@ class KnowledgeGraphEvaluator:
         }
 
     def evaluate_all(self) -> Dict[str, Any]:
-        """Run all evaluations."""
-        return {
-            "identification_distribution": self.calculate_identification_distribution(),
-            "type_classification_quality": self.calculate_type_classification_quality(),
-            "graph_coverage": self.calculate_graph_coverage(),
-            "relationship_precision": self.calculate_relationship_precision_heuristics(),
+        """
+        Run all evaluations.
+
+        The metrics only read the precomputed edge columns, so they run in a
+        thread pool and overlap wherever numpy/pandas release the GIL.
+        """
+        metrics = {
+            "identification_distribution": self.calculate_identification_distribution,
+            "type_classification_quality": self.calculate_type_classification_quality,
+            "graph_coverage": self.calculate_graph_coverage,
+            "relationship_precision": self.calculate_relationship_precision_heuristics,
         }
+        with ThreadPoolExecutor(max_workers=len(metrics)) as executor:
+            futures = {name: executor.submit(fn) for name, fn in metrics.items()}
+            return {name: future.result() for name, future in futures.items()}
 
 
 def quick_evaluate(graph: Dict = None, neo4j_config: Dict = None) -> Dict[str, Any]:
@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Iterator, Tuple
 
 
 class TextExtractor(ABC):
     @abstractmethod
     def extract(self, text: str) -> Dict[int, str]:
         pass
+
+    def iter_extract(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (id, text) pairs; extractors may override to skip the dict."""
+        yield from self.extract(text).items()
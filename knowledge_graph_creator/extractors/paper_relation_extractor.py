@@ -1,14 +1,85 @@
+import asyncio
 import json
-import time
-from typing import Dict, List, Optional
+import re
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from loguru import logger
 from neo4j import GraphDatabase
 from pydantic import ValidationError
 
 from knowledge_graph_creator.llm.llm_inference import LLMInference
-from knowledge_graph_creator.llm.prompts import EXTRACT_PROMPT
+from knowledge_graph_creator.llm.prompts import EXTRACT_SYSTEM, render_extract_user
 from knowledge_graph_creator.llm.schema import RelationshipAnalysis
+from knowledge_graph_creator.rate_limiter import RateLimiter
+from knowledge_graph_creator.utils import chunked, json_dumps, run_sync
+
+# Triplet queries match on paper_id and filter/sort on year and citation_count.
+# The uniqueness constraint doubles as the paper_id index and matches the one
+# created by AcademicKnowledgeGraph, so running both is a no-op.
+_INDEX_CYPHER = [
+    "CREATE CONSTRAINT paper_id_unique IF NOT EXISTS "
+    "FOR (p:Paper) REQUIRE p.paper_id IS UNIQUE",
+    "CREATE RANGE INDEX paper_year_idx IF NOT EXISTS FOR (p:Paper) ON (p.year)",
+    "CREATE RANGE INDEX paper_cc_idx IF NOT EXISTS "
+    "FOR (p:Paper) ON (p.citation_count)",
+    "CREATE RANGE INDEX paper_year_cc_idx IF NOT EXISTS "
+    "FOR (p:Paper) ON (p.year, p.citation_count)",
+]
+
+# Relation types become relationship labels, so only plain identifiers pass
+_RELATION_LABEL_RE = re.compile(r"^[A-Z][A-Z0-9_]*$")
+
+# One UNWIND per relation label; the label cannot be a query parameter
+_SAVE_RELATIONSHIPS_CYPHER = """
+UNWIND $rows AS row
+MATCH (citing:Paper {{paper_id: row.citing_id}})
+MATCH (cited:Paper {{paper_id: row.cited_id}})
+MERGE (citing)-[r:{label}]->(cited)
+ON CREATE SET
+    r.confidence = row.confidence,
+    r.evidence = row.evidence,
+    r.explanation = row.explanation,
+    r.extracted_by = 'llm',
+    r.created_at = datetime()
+ON MATCH SET
+    r.confidence = CASE
+        WHEN row.confidence = 'high' THEN row.confidence
+        ELSE r.confidence
+    END,
+    r.updated_at = datetime()
+"""
+
+# Mixed-label variant: apoc.merge.relationship takes the label as a value, so
+# every row goes through one UNWIND. Confidence is upgraded after the merge,
+# which leaves newly created relationships unchanged.
+_SAVE_RELATIONSHIPS_APOC_CYPHER = """
+UNWIND $rows AS row
+MATCH (citing:Paper {paper_id: row.citing_id})
+MATCH (cited:Paper {paper_id: row.cited_id})
+CALL apoc.merge.relationship(
+    citing,
+    row.relation_label,
+    {},
+    {
+        confidence: row.confidence,
+        evidence: row.evidence,
+        explanation: row.explanation,
+        extracted_by: 'llm',
+        created_at: datetime()
+    },
+    cited,
+    {updated_at: datetime()}
+) YIELD rel
+SET rel.confidence = CASE
+    WHEN row.confidence = 'high' THEN row.confidence
+    ELSE rel.confidence
+END
+"""
+
+# Records pulled from the server per Bolt round trip when streaming triplets
+DEFAULT_TRIPLET_PAGE_SIZE = 1000
 
 
 class PaperRelationExtractor:
@@ -22,23 +93,64 @@ class PaperRelationExtractor:
         user: str,
         password: str,
         llm_client: LLMInference,
-        min_delay: int = 1,
+        min_delay: float = 1,
+        batch_size: int = 16,
+        max_rate: Optional[float] = None,
+        time_period: Optional[float] = None,
+        use_apoc: bool = False,
     ):
+        """
+        Args:
+            uri: Neo4j database URI
+            user: Database username
+            password: Database password
+            llm_client: LLM client used for extraction
+            min_delay: Average seconds between LLM calls when no explicit rate is set
+            batch_size: Number of triplets sent to the LLM concurrently
+            max_rate: Maximum number of LLM calls per time period
+            time_period: Rate limit window in seconds
+            use_apoc: Save relationships of every label in one query with
+                apoc.merge.relationship (requires the APOC plugin)
+        """
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
         self.llm_client = llm_client
-        self.min_delay = min_delay  # seconds between calls
+        self.min_delay = min_delay
+        self.batch_size = batch_size
+        self.use_apoc = use_apoc
+        # Defaults to one call per `min_delay` on average, in bursts of a batch
+        self.rate_limiter = RateLimiter(
+            max_rate=max_rate or batch_size,
+            time_period=time_period or batch_size * max(min_delay, 0.001),
+        )
+        self._ensure_indexes()
 
     def close(self):
         """Close database connection."""
         self.driver.close()
 
+    def _ensure_indexes(self):
+        """Create the indexes used by the triplet queries if they are missing."""
+        with self.driver.session() as session:
+            for index_query in _INDEX_CYPHER:
+                try:
+                    session.run(index_query).consume()
+                    logger.info(f"Index created/verified: {index_query}")
+                except Exception as e:
+                    logger.warning(f"Index creation warning: {e}")
+
     def get_non_processed_triplets(
         self,
         min_citation_count: int = 0,
         head_min_year: int = 2022,
         tail_min_year: int = 2022,
-    ) -> List[Dict]:
-        """Extract citation triplets that have not been processed yet."""
+        page_size: int = DEFAULT_TRIPLET_PAGE_SIZE,
+    ) -> Iterator[Dict]:
+        """
+        Extract citation triplets that have not been processed yet.
+
+        Triplets are yielded lazily from the result cursor, `page_size` records
+        per server round trip, so the full result set is never held in memory.
+        """
         query = """
         MATCH (tail:Paper)-[:CITES]->(head:Paper)
         WHERE head.abstract IS NOT NULL 
@@ -65,22 +177,22 @@ class PaperRelationExtractor:
         ORDER BY head.citation_count DESC
 
         """
-        with self.driver.session() as session:
-            result = session.run(
-                query,
-                min_citation_count=min_citation_count,
-                head_min_year=head_min_year,
-                tail_min_year=tail_min_year,
-            )
-            return [dict(record) for record in result]
+        yield from self._stream_triplets(
+            query,
+            page_size,
+            min_citation_count=min_citation_count,
+            head_min_year=head_min_year,
+            tail_min_year=tail_min_year,
+        )
 
     def get_all_triplets(
         self,
         min_citation_count: int = 0,
         head_min_year: int = 2022,
         tail_min_year: int = 2022,
-    ) -> List[Dict]:
-        """Extract all citation triplets with valid abstracts."""
+        page_size: int = DEFAULT_TRIPLET_PAGE_SIZE,
+    ) -> Iterator[Dict]:
+        """Extract all citation triplets with valid abstracts, yielded lazily."""
         query = """
         MATCH (tail:Paper)-[:CITES]->(head:Paper)
         WHERE head.abstract IS NOT NULL 
@@ -96,14 +208,19 @@ class PaperRelationExtractor:
                head.abstract AS head_abstract
         ORDER BY head.citation_count DESC
         """
-        with self.driver.session() as session:
-            result = session.run(
-                query,
-                min_citation_count=min_citation_count,
-                head_min_year=head_min_year,
-                tail_min_year=tail_min_year,
-            )
-            return [dict(record) for record in result]
+        yield from self._stream_triplets(
+            query,
+            page_size,
+            min_citation_count=min_citation_count,
+            head_min_year=head_min_year,
+            tail_min_year=tail_min_year,
+        )
+
+    def _stream_triplets(self, query: str, page_size: int, **params) -> Iterator[Dict]:
+        """Yield records of `query` as dicts, fetching `page_size` at a time."""
+        with self.driver.session(fetch_size=page_size) as session:
+            for record in session.run(query, **params):
+                yield dict(record)
 
     def extract_relation_with_structured_llm(
         self,
@@ -115,13 +232,11 @@ class PaperRelationExtractor:
         """
         Extract relation between citing and cited paper using LLM.
         Includes retry logic for validation errors.
+
+        The LLM client caches responses on disk by prompt, so identical paper
+        pairs are only sent to the LLM once across runs.
         """
-        prompt = EXTRACT_PROMPT.format(
-            source_title=citing_paper.get("title", "N/A"),
-            source_abstract=citing_paper.get("abstract", "N/A"),
-            target_title=cited_paper.get("title", "N/A"),
-            target_abstract=cited_paper.get("abstract", "N/A"),
-        )
+        prompt = self._build_prompt(citing_paper, cited_paper)
 
         last_error = None
         for attempt in range(max_retries + 1):
@@ -129,6 +244,7 @@ class PaperRelationExtractor:
                 response = self.llm_client.structured_invoke(
                     prompt=prompt,
                     schema=schema,
+                    system_prompt=EXTRACT_SYSTEM,
                 )
                 if not isinstance(response, RelationshipAnalysis):
                     logger.error(f"{response}")
@@ -145,6 +261,51 @@ class PaperRelationExtractor:
         logger.error(f"All retries exhausted: {last_error}")
         return None
 
+    @staticmethod
+    def _build_prompt(citing_paper: Dict, cited_paper: Dict) -> str:
+        """
+        Fill the per-pair user message with both papers' titles and abstracts.
+
+        The instructions are sent separately as `EXTRACT_SYSTEM`, so every
+        request starts with the same cacheable prefix.
+        """
+        return render_extract_user(
+            source_title=citing_paper.get("title", "N/A"),
+            source_abstract=citing_paper.get("abstract", "N/A"),
+            target_title=cited_paper.get("title", "N/A"),
+            target_abstract=cited_paper.get("abstract", "N/A"),
+        )
+
+    async def extract_relation_async(
+        self,
+        citing_paper: Dict,
+        cited_paper: Dict,
+        schema: type = RelationshipAnalysis,
+        max_retries: int = 2,
+    ) -> Optional[RelationshipAnalysis]:
+        """
+        Async variant of `extract_relation_with_structured_llm`.
+
+        Waits for the rate limiter instead of sleeping a fixed delay, then runs
+        the blocking LLM call in a worker thread so batches overlap. Cache hits
+        return immediately without taking a rate limiter token.
+        """
+        prompt = self._build_prompt(citing_paper, cited_paper)
+        cached = self.llm_client.cached_structured_output(
+            prompt, schema, EXTRACT_SYSTEM
+        )
+        if cached is not None:
+            return cached
+
+        async with self.rate_limiter:
+            return await asyncio.to_thread(
+                self.extract_relation_with_structured_llm,
+                citing_paper,
+                cited_paper,
+                schema,
+                max_retries,
+            )
+
     def save_relationships(
         self,
         citing_id: str,
@@ -155,79 +316,248 @@ class PaperRelationExtractor:
         if not analysis.relationships:
             return
 
-        for rel in analysis.relationships:
-            relation_label = rel.type.upper().replace("-", "_").replace(" ", "_")
-            query = f"""
-            MATCH (citing:Paper {{paper_id: $citing_id}})
-            MATCH (cited:Paper {{paper_id: $cited_id}})
-            MERGE (citing)-[r:{relation_label}]->(cited)
-            ON CREATE SET 
-                r.confidence = $confidence,
-                r.evidence = $evidence,
-                r.explanation = $explanation,
-                r.extracted_by = 'llm',
-                r.created_at = datetime()
-            ON MATCH SET
-                r.confidence = CASE WHEN $confidence = 'high' THEN $confidence ELSE r.confidence END,
-                r.updated_at = datetime()
-            """
-            with self.driver.session() as session:
-                session.run(
-                    query,
-                    citing_id=citing_id,
-                    cited_id=cited_id,
-                    confidence=rel.confidence,
-                    evidence=rel.evidence,
-                    explanation=rel.explanation,
-                )
+        self.save_relationships_batch(
+            self.relationship_rows(citing_id, cited_id, analysis)
+        )
+
+    @staticmethod
+    def relationship_rows(
+        citing_id: str, cited_id: str, analysis: RelationshipAnalysis
+    ) -> List[Dict]:
+        """Flatten an analysis into rows for `save_relationships_batch`."""
+        return [
+            {
+                "citing_id": citing_id,
+                "cited_id": cited_id,
+                "relation_label": rel.type.upper().replace("-", "_").replace(" ", "_"),
+                "confidence": rel.confidence,
+                "evidence": rel.evidence,
+                "explanation": rel.explanation,
+            }
+            for rel in analysis.relationships
+        ]
+
+    def save_relationships_batch(self, rows: List[Dict]) -> int:
+        """
+        Save relationship rows from many triplets in one transaction.
+
+        Rows are grouped by relation label and each group is written with a
+        single UNWIND query, instead of one session and query per relationship.
+        With `use_apoc`, all rows are written by one UNWIND query regardless of
+        label.
+
+        Args:
+            rows: Rows as built by `relationship_rows`
+
+        Returns:
+            Number of rows submitted
+        """
+        rows_by_label: Dict[str, List[Dict]] = defaultdict(list)
+        for row in rows:
+            label = row["relation_label"]
+            if not _RELATION_LABEL_RE.match(label):
+                logger.warning(f"Skipping invalid relation label: {label!r}")
+                continue
+            rows_by_label[label].append(row)
+
+        if not rows_by_label:
+            return 0
+
+        def write(tx):
+            if self.use_apoc:
+                all_rows = [row for group in rows_by_label.values() for row in group]
+                tx.run(_SAVE_RELATIONSHIPS_APOC_CYPHER, rows=all_rows).consume()
+                return
+            for label, label_rows in rows_by_label.items():
+                tx.run(
+                    _SAVE_RELATIONSHIPS_CYPHER.format(label=label), rows=label_rows
+                ).consume()
+
+        with self.driver.session() as session:
+            session.execute_write(write)
+
+        return sum(len(label_rows) for label_rows in rows_by_label.values())
 
     def process_all_triplets(
         self,
         min_citation_count: int = 0,
         head_min_year: int = 2022,
         tail_min_year: int = 2022,
-    ) -> List[Dict]:
-        """Process all triplets and extract semantic relations."""
+    ) -> Iterator[Dict]:
+        """
+        Process all triplets and extract semantic relations.
+
+        Triplets are streamed from the database and sent to the LLM
+        `batch_size` at a time, throttled by the rate limiter. Each batch is
+        saved in one transaction on a background writer thread while the next
+        batch is extracted, with at most one write in flight. Results are
+        yielded as each batch completes, so nothing is processed until the
+        generator is consumed and only the current batch is held in memory.
+        """
         triplets = self.get_all_triplets(
             min_citation_count, head_min_year, tail_min_year
         )
-        logger.info(f"Found {len(triplets)} triplets to process")
+        logger.info(f"Processing triplets in batches of {self.batch_size}")
 
-        results = []
-        for idx, triplet in enumerate(triplets):
-            citing_paper = {
-                "title": triplet["tail_title"],
-                "abstract": triplet["tail_abstract"],
-            }
-            cited_paper = {
-                "title": triplet["head_title"],
-                "abstract": triplet["head_abstract"],
-            }
+        extracted = 0
+        pending_write: Optional[Future] = None
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            for batch_number, batch in enumerate(chunked(triplets, self.batch_size)):
+                logger.info(
+                    f"Processing batch {batch_number + 1}: triplets "
+                    f"{batch_number * self.batch_size + 1}-"
+                    f"{batch_number * self.batch_size + len(batch)}"
+                )
+                analyses = run_sync(
+                    self._closing_llm_client(self._extract_batch_async(batch))
+                )
 
-            logger.info(
-                f"Processing {idx + 1}/{len(triplets)}: {triplet['tail_id']} -> {triplet['head_id']}"
-            )
+                batch_rows = []
+                batch_results = []
+                for triplet, analysis in zip(batch, analyses):
+                    if analysis and analysis.relationships:
+                        batch_rows.extend(
+                            self.relationship_rows(
+                                triplet["tail_id"], triplet["head_id"], analysis
+                            )
+                        )
+                        batch_results.append((triplet, analysis))
 
-            analysis = self.extract_relation_with_structured_llm(
-                citing_paper, cited_paper
-            )
+                # Surface a failed write before queueing the next one
+                if pending_write is not None:
+                    pending_write.result()
+                pending_write = writer.submit(self.save_relationships_batch, batch_rows)
 
-            if analysis and analysis.relationships:
-                self.save_relationships(
-                    triplet["tail_id"], triplet["head_id"], analysis
-                )
-                results.append(
-                    {
+                for triplet, analysis in batch_results:
+                    extracted += 1
+                    yield {
                         "citing_id": triplet["tail_id"],
                         "cited_id": triplet["head_id"],
                         "relationships": [
                             r.model_dump() for r in analysis.relationships
                         ],
                     }
+
+            if pending_write is not None:
+                pending_write.result()
+
+        logger.info(f"Extracted relationships for {extracted} triplets")
+
+    def process_all_triplets_to_jsonl(
+        self,
+        path: str,
+        min_citation_count: int = 0,
+        head_min_year: int = 2022,
+        tail_min_year: int = 2022,
+    ) -> int:
+        """
+        Process all triplets and stream the results to a JSON Lines file.
+
+        Args:
+            path: Output file, one result object per line
+            min_citation_count: Minimum citation count of the cited paper
+            head_min_year: Minimum publication year of the cited paper
+            tail_min_year: Minimum publication year of the citing paper
+
+        Returns:
+            Number of results written
+        """
+        written = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for result in self.process_all_triplets(
+                min_citation_count, head_min_year, tail_min_year
+            ):
+                f.write(json_dumps(result))
+                f.write("\n")
+                written += 1
+        return written
+
+    async def _closing_llm_client(self, coro):
+        """
+        Await `coro`, then close the LLM async HTTP client.
+
+        The client is bound to the event loop it was first used on, so it has
+        to be closed before the loop started by `run_sync` for each batch
+        finishes.
+        """
+        try:
+            return await coro
+        finally:
+            await self.llm_client.aclose_async_client()
+
+    async def _extract_batch_async(
+        self, batch: List[Dict]
+    ) -> List[Optional[RelationshipAnalysis]]:
+        """
+        Run LLM extraction over one batch of triplets.
+
+        Cache misses are sent to the LLM in a single batch call; pairs whose
+        response fails to parse fall back to the per-pair path with retries.
+        Triplets that render the same prompt (e.g. duplicate nodes of one
+        paper) share a single request.
+        """
+        schema = RelationshipAnalysis
+        prompts = [
+            self._build_prompt(*self._triplet_papers(triplet)) for triplet in batch
+        ]
+        analyses = [
+            self.llm_client.cached_structured_output(prompt, schema, EXTRACT_SYSTEM)
+            for prompt in prompts
+        ]
+        first_by_prompt: Dict[str, int] = {}
+        for i, analysis in enumerate(analyses):
+            if analysis is None:
+                first_by_prompt.setdefault(prompts[i], i)
+        misses = list(first_by_prompt.values())
+        if not misses:
+            return analyses
+
+        for _ in misses:
+            await self.rate_limiter.aacquire()
+        try:
+            responses = await self.llm_client.abatch_structured_invoke(
+                [prompts[i] for i in misses],
+                schema,
+                system_prompt=EXTRACT_SYSTEM,
+                max_concurrency=self.batch_size,
+                return_exceptions=True,
+            )
+        except Exception as e:
+            logger.error(f"Batch LLM extraction failed: {e}")
+            responses = [e] * len(misses)
+
+        failed = []
+        for i, response in zip(misses, responses):
+            if isinstance(response, RelationshipAnalysis):
+                analyses[i] = response
+            else:
+                failed.append(i)
+
+        if failed:
+            logger.warning(f"Retrying {len(failed)} failed extractions individually")
+            retried = await asyncio.gather(
+                *(
+                    self.extract_relation_async(*self._triplet_papers(batch[i]))
+                    for i in failed
                 )
+            )
+            for i, analysis in zip(failed, retried):
+                analyses[i] = analysis
 
-            # Rate limiting for Groq API
-            time.sleep(self.min_delay)
+        for i, prompt in enumerate(prompts):
+            if analyses[i] is None:
+                analyses[i] = analyses[first_by_prompt[prompt]]
+        return analyses
 
-        logger.info(f"Extracted relationships for {len(results)} triplets")
-        return results
+    @staticmethod
+    def _triplet_papers(triplet: Dict) -> Tuple[Dict, Dict]:
+        """Split a triplet row into (citing_paper, cited_paper) prompt inputs."""
+        citing_paper = {
+            "title": triplet["tail_title"],
+            "abstract": triplet["tail_abstract"],
+        }
+        cited_paper = {
+            "title": triplet["head_title"],
+            "abstract": triplet["head_abstract"],
+        }
+        return citing_paper, cited_paper
@@ -1,9 +1,37 @@
 import re
 from dataclasses import asdict, dataclass
+from itertools import starmap
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
 from loguru import logger
 
+try:
+    import regex as _regex_engine
+except ImportError:  # optional dependency, fall back to the stdlib engine
+    _regex_engine = None
+
+_REF_PATTERN = (
+    r"^(?P<authors>.+?).\s*(?P<year>\d{4})\.\s*(?P<title>.+?)\.\s*"
+    r"(?P<publish>[^,.]+)(?:[.,]*\s*(?P<page_or_volume>.*))?$"
+)
+
+# Seconds a single reference may spend in the matcher (`regex` engine only)
+_REF_MATCH_TIMEOUT = 1.0
+
+# Compiled once at import time; parsing a bibliography calls this per reference.
+# The `regex` engine is preferred when installed because it can abort a match
+# that backtracks for too long on malformed reference text.
+if _regex_engine is not None:
+    _REF_RE = _regex_engine.compile(_REF_PATTERN, _regex_engine.DOTALL)
+    _MATCH_KWARGS = {"timeout": _REF_MATCH_TIMEOUT}
+else:
+    _REF_RE = re.compile(_REF_PATTERN, re.DOTALL)
+    _MATCH_KWARGS = {}
+
 
-@dataclass
+# Slotted: a bibliography creates one instance per reference and only reads
+# a few attributes, so skip the per-instance __dict__
+@dataclass(slots=True)
 class ReferenceDetails:
     id_: int
     authors: str
@@ -36,8 +64,11 @@ class ReferenceDetailsExtractor:
     @staticmethod
     def parse_with_regex(ref_id: int, ref_text: str) -> ReferenceDetails | None:
 
-        pattern = r"^(?P<authors>.+?).\s*(?P<year>\d{4})\.\s*(?P<title>.+?)\.\s*(?P<publish>[^,.]+)(?:[.,]*\s*(?P<page_or_volume>.*))?$"
-        match = re.match(pattern, ref_text.strip(), re.DOTALL)
+        try:
+            match = _REF_RE.match(ref_text.strip(), **_MATCH_KWARGS)
+        except TimeoutError:
+            logger.error(f"Timed out parsing reference {ref_id} - '{ref_text}'")
+            return None
         if not match:
             logger.error(f"Error parsing reference {ref_id} - '{ref_text}': {match}")
             return None
@@ -58,6 +89,49 @@ class ReferenceDetailsExtractor:
             page_or_volume=page_or_volume.strip(),
         )
 
+    @staticmethod
+    def iter_many(
+        references: Union[Dict[int, str], Iterable[Tuple[int, str]]],
+    ) -> Iterator[ReferenceDetails]:
+        """
+        Lazily parse a bibliography with the compiled reference pattern.
+
+        Each reference is parsed only when the consumer asks for it, so a
+        streaming consumer can start its API calls after the first parse and
+        never parses references past its `max_papers` cut-off.
+
+        Args:
+            references: Mapping of reference number to raw reference text, or
+                (number, text) pairs
+
+        Returns:
+            Iterator of parsed details in input order; references that did not
+            match are logged by `parse_with_regex` and skipped
+        """
+        if isinstance(references, dict):
+            references = references.items()
+        # filter/starmap keep the per-reference loop and None check in C
+        return filter(
+            None, starmap(ReferenceDetailsExtractor.parse_with_regex, references)
+        )
+
+    @staticmethod
+    def parse_many(
+        references: Union[Dict[int, str], Iterable[Tuple[int, str]]],
+    ) -> List[ReferenceDetails]:
+        """
+        Parse a whole bibliography with the compiled reference pattern.
+
+        Args:
+            references: Mapping of reference number to raw reference text, or
+                (number, text) pairs
+
+        Returns:
+            Parsed details in input order; references that did not match are
+            logged by `parse_with_regex` and left out
+        """
+        return list(ReferenceDetailsExtractor.iter_many(references))
+
     @staticmethod
     def parse(ref_id: int, ref_text: str) -> ReferenceDetails:
         try:
@@ -1,14 +1,30 @@
-from typing import Dict
+import re
+from typing import Dict, Iterator, Tuple
 
 from knowledge_graph_creator.extractors.base import TextExtractor
+from knowledge_graph_creator.patterns import ReferencePattern
 
 
 class ReferenceExtractor(TextExtractor):
     def __init__(self, pattern: str):
         self.pattern = pattern
+        self._re = (
+            pattern.compiled
+            if isinstance(pattern, ReferencePattern)
+            else re.compile(pattern, re.DOTALL)
+        )
+        self._marker = pattern.marker if isinstance(pattern, ReferencePattern) else None
 
     def extract(self, text: str) -> Dict[int, str]:
-        import re
+        return dict(self.iter_extract(text))
 
-        matches = re.findall(self.pattern, text, re.DOTALL)
-        return {int(num): content.strip() for num, content in matches}
+    def iter_extract(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (reference number, reference text) pairs in document order."""
+        if self._marker is not None:
+            # [preamble, label, body, label, body, ...]
+            parts = self._marker.split(text)
+            for i in range(1, len(parts), 2):
+                yield int(parts[i]), parts[i + 1].strip()
+            return
+        for match in self._re.finditer(text):
+            yield int(match.group(1)), match.group(2).strip()
@@ -1,4 +1,10 @@
 # src/llm/__init__.py
-from .llm_inference import LLMInference, LLMConfig, GroqModel, get_llm
+from .llm_inference import (
+    BatchingLLMInference,
+    LLMInference,
+    LLMConfig,
+    GroqModel,
+    get_llm,
+)
 
-__all__ = ["LLMInference", "LLMConfig", "GroqModel", "get_llm"]
+__all__ = ["LLMInference", "BatchingLLMInference", "LLMConfig", "GroqModel", "get_llm"]
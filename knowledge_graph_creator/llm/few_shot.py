@@ -0,0 +1,21 @@
+# Worked example for the relation extraction prompt. Not sent by default to keep
+# prompts short; append it to EXTRACT_SYSTEM when debugging extraction quality.
+EXTRACT_EXAMPLE = """
+Example output:
+{
+  "relationships": [
+    {
+      "type": "Extends",
+      "confidence": "high",
+      "evidence": "Paper 1 mentions 'building upon the transformer architecture' while Paper 2 introduces 'the transformer model'",
+      "explanation": "Paper 1 explicitly extends the methodology introduced in Paper 2"
+    },
+    {
+      "type": "Outperforms",
+      "confidence": "medium",
+      "evidence": "Paper 1 reports '95% accuracy' while Paper 2 achieved '87% accuracy' on similar tasks",
+      "explanation": "Paper 1 demonstrates superior performance on comparable benchmarks"
+    }
+  ]
+}
+"""
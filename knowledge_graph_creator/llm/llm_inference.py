@@ -1,14 +1,26 @@
-from typing import Optional, List, Callable
+import asyncio
+from collections import defaultdict
+from typing import Dict, Optional, List, Callable, Set, Tuple
 from enum import Enum
+from functools import lru_cache, partial
 from dataclasses import dataclass, field
+import hashlib
 import os
 import json
 
+import httpx
 from langchain_core.exceptions import OutputParserException
+from loguru import logger
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, SystemMessage, BaseMessage
+from langchain_core.runnables import Runnable, RunnableLambda
 from pydantic import SecretStr, ValidationError
 
+from knowledge_graph_creator.cache import DEFAULT_LLM_CACHE_PATH, DiskCache
+from knowledge_graph_creator.llm.prompts import json_outline
+from knowledge_graph_creator.llm.schema import Relationship, RelationshipAnalysis
+from knowledge_graph_creator.utils import json_loads
+
 
 class GroqModel(Enum):
     """Available Groq models."""
@@ -21,54 +33,278 @@ class GroqModel(Enum):
     GPT_OSS_20B = "openai/gpt-oss-20b"
 
 
+# Connection pool shared by every request of one LLMInference, sized so a
+# batch's concurrent requests reuse warm keep-alive connections
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_HTTP_TIMEOUT = 60.0
+
+# Output token budget per known schema. A RelationshipAnalysis with a handful of
+# 20-word evidence/explanation pairs fits well inside these; decoding is paid per
+# token, so a runaway response is cut off instead of running to the model limit
+_SCHEMA_MAX_TOKENS: Dict[type, int] = {
+    RelationshipAnalysis: 512,
+    Relationship: 192,
+}
+
+# Model name -> enum member, for constant-time lookups in `get_llm`
+_MODEL_BY_VALUE: Dict[str, GroqModel] = {m.value: m for m in GroqModel}
+
+
 @dataclass
 class LLMConfig:
     """Configuration for LLM inference."""
 
     model: GroqModel = GroqModel.LLAMA_70B
     temperature: float = 0.3
-    max_tokens: Optional[int] = None
+    # Upper bound on generated tokens (None for the model's own limit)
+    max_tokens: Optional[int] = 1024
+
+
+def _log_cached_tokens(message: Optional[BaseMessage]):
+    """Log how many prompt tokens the provider served from its prompt cache."""
+    metadata = getattr(message, "response_metadata", None) or {}
+    usage = metadata.get("token_usage") or {}
+    details = usage.get("prompt_tokens_details") or {}
+    if "cached_tokens" in details:
+        logger.debug(
+            f"Prompt cache: {details['cached_tokens']}/"
+            f"{usage.get('prompt_tokens', '?')} prompt tokens cached"
+        )
+
+
+def _validate_json_object(schema: type, text: str):
+    """
+    Validate a JSON document against `schema`, as a parser error on failure.
+
+    The text is decoded with `json_loads` (orjson when installed), which is
+    faster than `schema.model_validate_json` for these small models.
+    """
+    try:
+        return schema.model_validate(json_loads(text))
+    except ValueError as e:
+        # Covers malformed JSON (json and orjson decode errors) and
+        # ValidationError alike
+        raise OutputParserException(
+            f"Response did not match schema {schema.__name__}"
+        ) from e
+
+
+def _parsed_or_raise(schema: type, output: dict):
+    """
+    Return the parsed structured output, falling back to validating the raw
+    message content against `schema`.
+
+    Raises the original parsing error when neither yields a valid object.
+    """
+    _log_cached_tokens(output.get("raw"))
+    if output.get("parsed") is not None:
+        return output["parsed"]
+    content = getattr(output.get("raw"), "content", None)
+    if isinstance(content, str) and content.strip():
+        try:
+            return _validate_json_object(schema, content)
+        except OutputParserException:
+            pass
+    raise output.get("parsing_error") or OutputParserException(
+        f"Response did not match schema {schema.__name__}"
+    )
+
+
+class _JsonObjectScanner:
+    """
+    Incrementally finds the end of the first top-level JSON object in a stream.
+
+    Braces inside string literals are ignored, so the object is reported as
+    complete exactly when its closing brace arrives.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> Optional[str]:
+        """Append `text` and return the complete object once it is closed."""
+        offset = len(self.buffer)
+        self.buffer += text
+        for i in range(offset, len(self.buffer)):
+            char = self.buffer[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"' and self._start >= 0:
+                self._in_string = True
+            elif char == "{":
+                if self._start < 0:
+                    self._start = i
+                self._depth += 1
+            elif char == "}" and self._start >= 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    return self.buffer[self._start : i + 1]
+        return None
+
+
+@lru_cache(maxsize=None)
+def _format_instructions(schema: type) -> str:
+    """Compact description of the JSON reply expected for `schema`."""
+    return f"Respond with JSON only:\n{json_outline(schema)}"
 
 
 class LLMInference:
     """Efficient Groq LLM inference client with structured output support."""
 
-    def __init__(self, api_key: SecretStr, config: Optional[LLMConfig] = None):
+    def __init__(
+        self,
+        api_key: SecretStr,
+        config: Optional[LLMConfig] = None,
+        prewarm_schemas: Optional[List[type]] = None,
+        use_cache: bool = True,
+        cache_path: str = DEFAULT_LLM_CACHE_PATH,
+    ):
+        """
+        Args:
+            api_key: Groq API key
+            config: Model and sampling configuration
+            prewarm_schemas: Schemas whose structured runnables are built up front,
+                so the first request does not pay the construction cost
+            use_cache: Whether to reuse structured responses stored on disk
+            cache_path: SQLite file backing the structured response cache
+        """
         self.config = config or LLMConfig()
         self._api_key = api_key
         self._llm: Optional[ChatGroq] = None
-        self._structured_cache: dict = {}
+        self._http_client: Optional[httpx.Client] = None
+        self._http_async_client: Optional[httpx.AsyncClient] = None
+        # Event loop the async client is bound to (None until first async use)
+        self._llm_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Keyed by the schema class itself: two schemas sharing a __name__
+        # (e.g. defined in different modules) must not share a runnable
+        self._structured_cache: Dict[type, Runnable] = {}
+        # Rebuilt with the LLM, so every new client starts warm
+        self._prewarm_schemas: List[type] = list(prewarm_schemas or [])
+        if self._prewarm_schemas:
+            self.llm()
+        # A response for a given model and prompt does not go stale
+        self.cache: Optional[DiskCache] = (
+            DiskCache(cache_path, expire_after=None) if use_cache else None
+        )
+
+    def close(self):
+        """Close the structured response cache and the sync HTTP client."""
+        if self.cache is not None:
+            self.cache.close()
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+        self._llm = None
+
+    async def aclose_async_client(self):
+        """
+        Close the async HTTP client; the next call builds a new one.
+
+        The client is bound to the event loop it is used on, so call this before
+        a loop started with `run_sync` finishes.
+        """
+        if self._http_async_client is not None:
+            await self._http_async_client.aclose()
+            self._http_async_client = None
+        self._llm = None
+        self._llm_loop = None
+
+    async def aclose(self):
+        """Close everything `close` does, plus the async HTTP client."""
+        self.close()
+        await self.aclose_async_client()
 
     def llm(self) -> ChatGroq:
-        """Lazily initialized Groq LLM client."""
+        """
+        Lazily initialized Groq LLM client.
+
+        Sync and async calls each go through one pooled HTTP client, instead of
+        per-client defaults. The async client is bound to the event loop it is
+        first used on; callers running batches on short-lived loops (see
+        `run_sync`) close it with `aclose_async_client` before each loop ends.
+        """
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None and self._llm_loop not in (None, loop):
+            # The old client's connections belong to another loop, so they can
+            # neither be reused nor closed from this one
+            logger.warning(
+                "LLM async HTTP client was not closed before its event loop "
+                "ended; call aclose_async_client() to release its connections"
+            )
+            self._http_async_client = None
+            self._llm = None
+        if loop is not None:
+            self._llm_loop = loop
         if self._llm is None:
+            if self._http_client is None:
+                self._http_client = httpx.Client(
+                    limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+                )
+            if self._http_async_client is None:
+                self._http_async_client = httpx.AsyncClient(
+                    limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+                )
             self._llm = ChatGroq(
                 model=self.config.model.value,
                 temperature=self.config.temperature,
                 max_tokens=self.config.max_tokens,
                 api_key=self._api_key,
+                http_client=self._http_client,
+                http_async_client=self._http_async_client,
             )
+            # Structured runnables wrap the previous LLM and its HTTP clients
+            self._structured_cache.clear()
+            for schema in self._prewarm_schemas:
+                self.structured_llm(schema)
         return self._llm
 
-    def structured_llm(self, schema: type) -> ChatGroq:
+    def structured_llm(self, schema: type) -> Runnable:
         """Get LLM with structured output for a given Pydantic schema."""
-        schema_name = schema.__name__
-        if schema_name not in self._structured_cache:
-
-            self._structured_cache[schema_name] = (
-                self.llm()
-                .with_structured_output(schema)
-                .with_retry(
-                    retry_if_exception_type=(
-                        OutputParserException,
-                        ValidationError,
-                        json.JSONDecodeError,
-                    ),
-                    stop_after_attempt=2,
-                    wait_exponential_jitter=True,
+        # Rebuilds the LLM (and the cached runnables) if its clients were closed
+        self.llm()
+        if schema not in self._structured_cache:
+            # include_raw keeps the raw message, so a response whose tool call
+            # could not be parsed can still be validated from its JSON content
+            self._structured_cache[schema] = (
+                self._schema_llm(schema).with_structured_output(
+                    schema, include_raw=True
                 )
+                | RunnableLambda(partial(_parsed_or_raise, schema))
+            ).with_retry(
+                retry_if_exception_type=(
+                    OutputParserException,
+                    ValidationError,
+                    json.JSONDecodeError,
+                ),
+                stop_after_attempt=2,
+                wait_exponential_jitter=True,
             )
-        return self._structured_cache[schema_name]
+        return self._structured_cache[schema]
+
+    def _schema_llm(self, schema: type) -> ChatGroq:
+        """
+        Return the LLM with `max_tokens` tightened to the schema's output budget.
+
+        The copy shares the HTTP clients of `llm()`; schemas without a budget,
+        or with one above `config.max_tokens`, use `llm()` unchanged.
+        """
+        llm = self.llm()
+        budget = _SCHEMA_MAX_TOKENS.get(schema)
+        if budget is None or (llm.max_tokens is not None and llm.max_tokens <= budget):
+            return llm
+        return llm.model_copy(update={"max_tokens": budget})
 
     @staticmethod
     def _build_messages(
@@ -81,6 +317,38 @@ class LLMInference:
         messages.append(HumanMessage(content=prompt))
         return messages
 
+    def _cache_key(
+        self, prompt: str, schema: type, system_prompt: Optional[str] = None
+    ) -> str:
+        """Hash the model, schema and full prompt that determine a response."""
+        key = "\n".join(
+            [self.config.model.value, schema.__name__, system_prompt or "", prompt]
+        )
+        return hashlib.blake2b(key.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str, schema: type):
+        """Return the cached response for `key`, or None on a miss."""
+        if self.cache is None:
+            return None
+        data = self.cache.get(key)
+        if data is None:
+            return None
+        try:
+            return schema.model_validate(data)
+        except ValidationError:
+            return None
+
+    def _cache_set(self, key: str, schema: type, response):
+        """Cache `response` if it is a valid instance of `schema`."""
+        if self.cache is not None and isinstance(response, schema):
+            self.cache.set(key, response.model_dump(mode="json"))
+
+    def cached_structured_output(
+        self, prompt: str, schema: type, system_prompt: Optional[str] = None
+    ):
+        """Return the cached structured response for a prompt, or None."""
+        return self._cache_get(self._cache_key(prompt, schema, system_prompt), schema)
+
     def invoke(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Send prompt to LLM and return response."""
         messages = self._build_messages(prompt, system_prompt)
@@ -89,9 +357,151 @@ class LLMInference:
     def structured_invoke(
         self, prompt: str, schema: type, system_prompt: Optional[str] = None
     ):
-        """Invoke LLM with structured output matching the given Pydantic schema."""
+        """
+        Invoke LLM with structured output matching the given Pydantic schema.
+
+        Responses are cached on disk, so a repeated prompt skips the LLM call.
+        """
+        key = self._cache_key(prompt, schema, system_prompt)
+        cached = self._cache_get(key, schema)
+        if cached is not None:
+            return cached
         messages = self._build_messages(prompt, system_prompt)
-        return self.structured_llm(schema).invoke(messages)
+        response = self.structured_llm(schema).invoke(messages)
+        self._cache_set(key, schema, response)
+        return response
+
+    def structured_invoke_fast(
+        self, prompt: str, schema: type, system_prompt: Optional[str] = None
+    ):
+        """
+        Structured invoke without tool calling.
+
+        Instead of the full JSON schema that `with_structured_output` sends as a
+        tool definition, the reply format is described by a compact outline of
+        `schema` appended to the system prompt (unless it already contains it),
+        and the first JSON object in the plain reply is validated directly.
+        Shares the on-disk response cache.
+
+        Raises:
+            OutputParserException: If the reply holds no valid object
+        """
+        instructions = _format_instructions(schema)
+        if not system_prompt:
+            system_prompt = instructions
+        elif json_outline(schema) not in system_prompt:
+            system_prompt = f"{system_prompt}\n{instructions}"
+
+        key = self._cache_key(prompt, schema, system_prompt)
+        cached = self._cache_get(key, schema)
+        if cached is not None:
+            return cached
+
+        messages = self._build_messages(prompt, system_prompt)
+        content = self._schema_llm(schema).invoke(messages).content
+        candidate = _JsonObjectScanner().feed(content)
+        if candidate is None:
+            raise OutputParserException(
+                f"Response contained no {schema.__name__} object"
+            )
+        response = _validate_json_object(schema, candidate)
+        self._cache_set(key, schema, response)
+        return response
+
+    def stream_structured_invoke(
+        self, prompt: str, schema: type, system_prompt: Optional[str] = None
+    ):
+        """
+        Structured invoke that streams plain JSON output and stops reading as
+        soon as the first JSON object is complete.
+
+        Meant for prompts that describe the JSON format themselves (e.g.
+        `RELATIONSHIP_COT_SYSTEM`): any text the model generates after the
+        object is never waited for. Shares the on-disk response cache.
+
+        Raises:
+            OutputParserException: If the stream ends without a valid object
+        """
+        key = self._cache_key(prompt, schema, system_prompt)
+        cached = self._cache_get(key, schema)
+        if cached is not None:
+            return cached
+
+        scanner = _JsonObjectScanner()
+        stream = self._schema_llm(schema).stream(
+            self._build_messages(prompt, system_prompt)
+        )
+        try:
+            for chunk in stream:
+                candidate = scanner.feed(chunk.content)
+                if candidate is not None:
+                    response = _validate_json_object(schema, candidate)
+                    self._cache_set(key, schema, response)
+                    return response
+        finally:
+            # Closing the generator closes the HTTP response, ending decoding
+            stream.close()
+
+        raise OutputParserException(
+            f"Stream ended without a complete {schema.__name__} object"
+        )
+
+    def batch_structured_invoke(
+        self,
+        prompts: List[str],
+        schema: type,
+        system_prompt: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> list:
+        """
+        Invoke structured output for many prompts in one LangChain batch call.
+
+        Cached prompts are answered from disk; only the rest are sent.
+
+        Args:
+            prompts: User prompts, one request each
+            schema: Pydantic schema every response must match
+            system_prompt: Optional system prompt shared by all requests
+            max_concurrency: Maximum number of requests in flight at once
+            return_exceptions: Return failures in place instead of raising
+
+        Returns:
+            Responses (or exceptions) in the same order as `prompts`
+        """
+        keys, responses, misses = self._batch_cache_lookup(
+            prompts, schema, system_prompt
+        )
+        if misses:
+            fresh = self.structured_llm(schema).batch(
+                [self._build_messages(prompts[i], system_prompt) for i in misses],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=return_exceptions,
+            )
+            self._batch_cache_store(keys, responses, misses, fresh, schema)
+        return responses
+
+    def _batch_cache_lookup(
+        self, prompts: List[str], schema: type, system_prompt: Optional[str]
+    ) -> Tuple[List[str], list, List[int]]:
+        """Return cache keys, cached responses (None on miss) and miss indices."""
+        keys = [self._cache_key(p, schema, system_prompt) for p in prompts]
+        responses = [self._cache_get(key, schema) for key in keys]
+        misses = [i for i, response in enumerate(responses) if response is None]
+        return keys, responses, misses
+
+    def _batch_cache_store(
+        self,
+        keys: List[str],
+        responses: list,
+        misses: List[int],
+        fresh: list,
+        schema: type,
+    ):
+        """Fill the missed slots of `responses` and cache the valid ones."""
+        for i, response in zip(misses, fresh):
+            responses[i] = response
+            self._cache_set(keys[i], schema, response)
 
     async def ainvoke(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Async invoke."""
@@ -102,13 +512,152 @@ class LLMInference:
     async def astructured_invoke(
         self, prompt: str, schema: type, system_prompt: Optional[str] = None
     ):
-        """Async structured invoke."""
+        """Async structured invoke, sharing the on-disk response cache."""
+        key = self._cache_key(prompt, schema, system_prompt)
+        cached = self._cache_get(key, schema)
+        if cached is not None:
+            return cached
         messages = self._build_messages(prompt, system_prompt)
-        return await self.structured_llm(schema).ainvoke(messages)
+        response = await self.structured_llm(schema).ainvoke(messages)
+        self._cache_set(key, schema, response)
+        return response
+
+    async def abatch_structured_invoke(
+        self,
+        prompts: List[str],
+        schema: type,
+        system_prompt: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> list:
+        """Async variant of `batch_structured_invoke`."""
+        keys, responses, misses = self._batch_cache_lookup(
+            prompts, schema, system_prompt
+        )
+        if misses:
+            fresh = await self.structured_llm(schema).abatch(
+                [self._build_messages(prompts[i], system_prompt) for i in misses],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=return_exceptions,
+            )
+            self._batch_cache_store(keys, responses, misses, fresh, schema)
+        return responses
+
+
+class BatchingLLMInference(LLMInference):
+    """
+    LLMInference that coalesces concurrent `astructured_invoke` calls.
+
+    Each call queues its prompt and awaits a future. A background task drains
+    the queue, collecting up to `max_batch` requests or whatever arrived within
+    `batch_window` seconds, and sends the requests sharing a schema and system
+    prompt as one `abatch_structured_invoke` call. Callers can keep awaiting
+    single pairs while the provider still sees batches, even under bursty
+    arrivals.
+    """
+
+    def __init__(
+        self,
+        api_key: SecretStr,
+        config: Optional[LLMConfig] = None,
+        max_batch: int = 32,
+        batch_window: float = 0.01,
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            api_key: Groq API key
+            config: Model and sampling configuration
+            max_batch: Maximum number of requests sent in one batch
+            batch_window: Seconds to wait for more requests after the first one
+            max_concurrency: Maximum number of requests of a batch in flight
+            **kwargs: Forwarded to `LLMInference`
+        """
+        super().__init__(api_key, config, **kwargs)
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.max_concurrency = max_concurrency
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def astructured_invoke(
+        self, prompt: str, schema: type, system_prompt: Optional[str] = None
+    ):
+        """Queue a structured request and wait for its batch to complete."""
+        cached = self.cached_structured_output(prompt, schema, system_prompt)
+        if cached is not None:
+            return cached
+        future = asyncio.get_running_loop().create_future()
+        self._get_queue().put_nowait((prompt, schema, system_prompt, future))
+        return await future
+
+    def _get_queue(self) -> asyncio.Queue:
+        """Return the request queue, starting the batcher on the running loop."""
+        loop = asyncio.get_running_loop()
+        # Queue and task are bound to one loop, and `run_sync` starts a fresh
+        # loop per call, so recreate them whenever the loop changes
+        if (
+            self._batcher is None
+            or self._batcher.done()
+            or self._batcher.get_loop() is not loop
+        ):
+            self._queue = asyncio.Queue()
+            self._batcher = loop.create_task(self._drain(self._queue))
+        return self._queue
+
+    async def _drain(self, queue: asyncio.Queue):
+        """Collect queued requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(items) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            groups = defaultdict(list)
+            for item in items:
+                groups[item[1], item[2]].append(item)
+            # Dispatch without awaiting, so the next batch is collected while
+            # this one is in flight
+            for (schema, system_prompt), group in groups.items():
+                task = loop.create_task(self._dispatch(schema, system_prompt, group))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(
+        self, schema: type, system_prompt: Optional[str], group: List[tuple]
+    ):
+        """Send one batch and resolve each request's future with its response."""
+        try:
+            responses = await self.abatch_structured_invoke(
+                [prompt for prompt, *_ in group],
+                schema,
+                system_prompt=system_prompt,
+                max_concurrency=self.max_concurrency,
+                return_exceptions=True,
+            )
+        except Exception as e:
+            responses = [e] * len(group)
+
+        for (*_, future), response in zip(group, responses):
+            if future.done():
+                continue
+            if isinstance(response, BaseException):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
 
 
 def get_llm(
     model: str = "llama-3.3-70b-versatile", temperature: float = 0.7
 ) -> LLMInference:
-    model_enum = next((m for m in GroqModel if m.value == model), GroqModel.LLAMA_70B)
+    model_enum = _MODEL_BY_VALUE.get(model, GroqModel.LLAMA_70B)
     return LLMInference(LLMConfig(model=model_enum, temperature=temperature))
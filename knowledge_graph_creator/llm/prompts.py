@@ -1,6 +1,79 @@
-EXTRACT_PROMPT = """
-You are an expert scientific literature analyst. Your task is to identify semantic relationships between two research papers by carefully analyzing their abstracts.
+import json
+from functools import lru_cache
+from typing import Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from knowledge_graph_creator.llm.schema import Relationship, RelationshipAnalysis
+
+
+def _outline(model: type) -> dict:
+    """Map each field of a pydantic model to a placeholder for its value type."""
+    outline = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        origin, args = get_origin(annotation), get_args(annotation)
+        if origin is Literal:
+            outline[name] = "|".join(args)
+        elif origin is list and issubclass(args[0], BaseModel):
+            outline[name] = [_outline(args[0])]
+        elif origin is Union and type(None) in args:
+            outline[name] = "string|null"
+        else:
+            outline[name] = "string"
+    return outline
+
+
+@lru_cache(maxsize=None)
+def json_outline(model: type) -> str:
+    """
+    Render a compact JSON outline of a pydantic model for use in prompts.
+
+    Generated from the schema the response is validated against, so the format
+    described to the model cannot drift from the parser.
+    """
+    return json.dumps(_outline(model), indent=2)
+
+
+def _escape_braces(text: str) -> str:
+    """Escape literal braces so `text` survives `str.format`."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+# The invariant instructions go in the system message so every request shares
+# the same prefix and the provider can reuse its prompt cache; only the paper
+# details in the user message change between requests. Kept short because every
+# instruction token is prefilled on every call.
+EXTRACT_SYSTEM = f"""
+You are an expert scientific literature analyst. Identify the semantic relationships Paper 1 (source) has with Paper 2 (target), using only their titles and abstracts given by the user. There may be 0, 1 or several; report only those clearly supported by the text, with specific evidence.
+
+Relationship types:
+1. Extends - Paper 1 builds upon or improves the method/framework of Paper 2
+2. Solves - Paper 1 addresses a problem or limitation identified in Paper 2
+3. Outperforms - Paper 1 reports better results than Paper 2's approach
+4. Validates - Paper 1 confirms the findings or methods of Paper 2
+5. Contradicts - Paper 1's findings conflict with those of Paper 2
+6. Requires - Paper 1 depends on concepts/methods of Paper 2 as a foundation
+7. Enables - Paper 2's tools, data or methods make Paper 1's work possible
+8. Adapts-from - Paper 1 applies Paper 2's approach to a new domain or problem
+9. Achieves - Paper 1 realizes a goal or application suggested in Paper 2
+10. Challenges - Paper 1 questions Paper 2's assumptions or validity
+
+Respond with JSON only:
+{json_outline(RelationshipAnalysis)}
+"""
+
+
+def render_extract_user(
+    source_title: str, source_abstract: str, target_title: str, target_abstract: str
+) -> str:
+    """
+    Build the per-pair user message for `EXTRACT_SYSTEM`.
 
+    An f-string renders several times faster than `EXTRACT_USER.format`, which
+    re-parses the template's replacement fields on every call.
+    """
+    return f"""
 **Paper 1 (Source Paper):**
 Title: {source_title}
 Abstract: {source_abstract}
@@ -8,124 +81,56 @@ Abstract: {source_abstract}
 **Paper 2 (Target Paper):**
 Title: {target_title}
 Abstract: {target_abstract}
+"""
 
-**Task:**
-Analyze the relationship between Paper 1 and Paper 2. Identify if Paper 1 has any of the following semantic relationships with Paper 2. Multiple relationships may exist simultaneously.
-
-**Relationship Types:**
-
-1. **Extends**: Paper 1 builds upon, extends, or improves the methodology, framework, or approach presented in Paper 2.
-
-2. **Solves**: Paper 1 addresses a problem, limitation, or challenge that was identified or left unsolved in Paper 2.
-
-3. **Outperforms**: Paper 1 reports better performance, results, or metrics compared to the method/approach in Paper 2.
-
-4. **Validates**: Paper 1 confirms, verifies, or provides supporting evidence for the findings, claims, or methods in Paper 2.
-
-5. **Contradicts**: Paper 1 presents findings, results, or conclusions that conflict with or challenge those in Paper 2.
-
-6. **Requires**: Paper 1 depends on, uses as a prerequisite, or builds directly upon concepts/methods from Paper 2 as a necessary foundation.
-
-7. **Enables**: Paper 2 provides tools, frameworks, datasets, or methodologies that make Paper 1's work possible.
-
-8. **Adapts-from**: Paper 1 modifies or applies the approach from Paper 2 to a different domain, problem, or context.
-
-9. **Achieves**: Paper 1 successfully implements or realizes a goal, objective, or application suggested in Paper 2.
-
-10. **Challenges**: Paper 1 questions the assumptions, methodology, or validity of Paper 2 without necessarily contradicting its results.
 
-**Instructions:**
-1. Read both abstracts carefully and consider their content jointly
-2. Identify ALL applicable relationships (there may be 0, 1, or multiple relationships)
-3. For each identified relationship, provide specific evidence from the abstracts
-4. Be precise and only identify relationships that are clearly supported by the text
+# Template form of `render_extract_user`, for callers that use `str.format`
+EXTRACT_USER = render_extract_user(
+    "{source_title}", "{source_abstract}", "{target_title}", "{target_abstract}"
+)
 
-**Output Format (JSON):**
-Return your analysis as a valid JSON object with the following structure:
+# Single-message variant for callers that do not send a system prompt
+EXTRACT_PROMPT = _escape_braces(EXTRACT_SYSTEM) + EXTRACT_USER
 
-{{
-  "relationships": [
-    {{
-      "type": "relationship_type_name",
-      "confidence": "high|medium|low",
-      "evidence": "Specific text or reasoning from the abstracts supporting this relationship",
-      "explanation": "Brief explanation of why this relationship exists"
-    }}
-  ],
-  "no_relationship_reason": "If no relationships found, explain why"
-}}
+RELATIONSHIP_COT_SYSTEM = f"""
+You analyze citation relationships in a scientific knowledge graph. Given the titles and abstracts of a citing and a cited paper, reason internally about each paper's contribution and how the citing paper uses the cited work, then choose the single PRIMARY relationship.
 
-**Example Output:**
-{{
-  "relationships": [
-    {{
-      "type": "Extends",
-      "confidence": "high",
-      "evidence": "Paper 1 mentions 'building upon the transformer architecture' while Paper 2 introduces 'the transformer model'",
-      "explanation": "Paper 1 explicitly extends the methodology introduced in Paper 2"
-    }},
-    {{
-      "type": "Outperforms",
-      "confidence": "medium",
-      "evidence": "Paper 1 reports '95% accuracy' while Paper 2 achieved '87% accuracy' on similar tasks",
-      "explanation": "Paper 1 demonstrates superior performance on comparable benchmarks"
-    }}
-  ]
-}}
+Relationship types:
+1. Extends - citing paper builds upon the cited methods/framework
+2. Solves - citing paper solves a problem identified in the cited paper
+3. Outperforms - citing paper performs better than the cited paper
+4. Validates - citing paper confirms the cited findings
+5. Contradicts - citing paper contradicts the cited conclusions
+6. Requires - citing paper needs the cited concepts/methods as a foundation
+7. Enables - cited work enables the citing paper's approach
+8. Adapts-from - citing paper adapts cited techniques to a new context
+9. Achieves - citing paper achieves goals stated in the cited paper
+10. Challenges - citing paper questions the cited assumptions or limitations
 
-Now analyze the relationship between the two papers provided above and return your response in the specified JSON format.
+Respond with JSON only:
+{json_outline(Relationship)}
 """
 
-RELATIONSHIP_PROMPT_COT = """
-You are an expert analyst examining **citation relationships** in a **scientific knowledge graph**.  
-Your goal is to determine how a **citing paper** semantically relates to a **cited paper**, using their titles and abstracts.
-
-
-## INPUT
 
+def render_relationship_cot_user(
+    citing_title: str, citing_abstract: str, cited_title: str, cited_abstract: str
+) -> str:
+    """Build the per-pair user message for `RELATIONSHIP_COT_SYSTEM`."""
+    return f"""
 ### CITING PAPER
-- **Title:** {citing_title}  
+- **Title:** {citing_title}
 - **Abstract:** {citing_abstract}
 
 ### CITED PAPER
-- **Title:** {cited_title}  
+- **Title:** {cited_title}
 - **Abstract:** {cited_abstract}
-
-## TASK (Reason Step-by-Step Internally)
-
-1. Identify the **core contribution** of the cited paper (problem, method, findings).
-2. Identify the **main contribution and intent** of the citing paper.
-3. Compare both papers to understand how the citing paper:
-   - uses,
-   - builds upon,
-   - evaluates,
-   - adapts,
-   - challenges, or
-   - depends on  
-   the cited work.
-4. Select the **single PRIMARY semantic relationship** that best describes this citation.
-
-
-## RELATIONSHIP TYPES (Choose Exactly One)
-
-1. **Extends** – Citing paper builds upon or extends methods/framework from cited paper  
-2. **Solves** – Citing paper solves a problem identified in cited paper  
-3. **Outperforms** – Citing paper demonstrates better performance than cited paper  
-4. **Validates** – Citing paper validates or confirms findings from cited paper  
-5. **Contradicts** – Citing paper contradicts or challenges cited paper’s conclusions  
-6. **Requires** – Citing paper requires concepts/methods from cited paper as a foundation  
-7. **Enables** – Cited paper’s work enables the citing paper’s approach  
-8. **Adapts-from** – Citing paper adapts techniques from cited paper to a new context  
-9. **Achieves** – Citing paper achieves goals or addresses challenges stated in cited paper  
-10. **Challenges** – Citing paper questions assumptions or limitations in cited paper  
-
-
-## OUTPUT FORMAT (Respond EXACTLY in this JSON)
-
-```json
-{
-  "relationship": "one of the 10 types above",
-  "confidence": "high | medium | low",
-  "evidence": "brief quote or paraphrase from the citing abstract supporting this"
-}
 """
+
+
+RELATIONSHIP_COT_USER = render_relationship_cot_user(
+    "{citing_title}", "{citing_abstract}", "{cited_title}", "{cited_abstract}"
+)
+
+RELATIONSHIP_PROMPT_COT = (
+    _escape_braces(RELATIONSHIP_COT_SYSTEM) + RELATIONSHIP_COT_USER
+)
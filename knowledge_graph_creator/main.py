@@ -17,6 +17,7 @@ def build_knowledge_graph(
     reference_pages: list[int],
     max_papers: int = None,
     use_settings_file: bool = False,
+    use_cache: bool = True,
 ):
     """
     Build a knowledge graph from a PDF paper.
@@ -30,6 +31,7 @@ def build_knowledge_graph(
         reference_pages: List of page numbers with references
         max_papers: Maximum number of papers to process
         use_settings_file: Whether or not to use the settings file
+        use_cache: Whether to cache Semantic Scholar responses on disk
     """
     load_dotenv()
 
@@ -51,6 +53,7 @@ def build_knowledge_graph(
             neo4j_user=settings.neo4j_user,
             neo4j_password=settings.neo4j_password,
             ss_api_key=settings.ss_api_key,
+            use_cache=use_cache,
         )
     else:
         orchestrator = PDFToKnowledgeGraphOrchestrator(
@@ -58,6 +61,7 @@ def build_knowledge_graph(
             neo4j_user=os.getenv("NEO4J_USER", "neo4j"),
             neo4j_password=os.getenv("NEO4J_PASSWORD"),
             ss_api_key=os.getenv("SS_API_KEY"),
+            use_cache=use_cache,
         )
 
     # Process PDF and build graph
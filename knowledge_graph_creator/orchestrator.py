@@ -1,16 +1,22 @@
-import time
-from typing import List, Literal, Optional
+import asyncio
+import warnings
+from itertools import chain
+from typing import List, Literal, Optional, Tuple
 
 from loguru import logger
 
 from knowledge_graph_creator.academic_graph_builder import AcademicGraphBuilder
-from knowledge_graph_creator.doc_extractor.pdf_extractor import PyMuPDFReader
+from knowledge_graph_creator.doc_extractor.pdf_extractor import (
+    MIN_PAGES_FOR_PARALLEL,
+    PyMuPDFReader,
+)
 from knowledge_graph_creator.extractors.reference_details import (
     ReferenceDetails,
     ReferenceDetailsExtractor,
 )
 from knowledge_graph_creator.extractors.reference_extractor import ReferenceExtractor
 from knowledge_graph_creator.patterns import ReferencePattern
+from knowledge_graph_creator.utils import run_sync
 
 
 class PDFToKnowledgeGraphOrchestrator:
@@ -22,15 +28,75 @@ class PDFToKnowledgeGraphOrchestrator:
         neo4j_user: str,
         neo4j_password: str,
         ss_api_key: str = None,
-        rate_limit_delay: float = 1.0,
+        rate_limit_delay: Optional[float] = None,
+        use_cache: bool = True,
+        ss_max_rate: Optional[float] = None,
+        ss_time_period: Optional[float] = None,
+        write_batch_size: int = 500,
     ):
+        """
+        Args:
+            neo4j_uri: Neo4j database URI
+            neo4j_user: Database username
+            neo4j_password: Database password
+            ss_api_key: Semantic Scholar API key
+            rate_limit_delay: Deprecated and ignored. Semantic Scholar calls are
+                throttled by a token bucket sized with `ss_max_rate`/`ss_time_period`.
+            use_cache: Whether to cache Semantic Scholar responses on disk
+            ss_max_rate: Semantic Scholar calls allowed per `ss_time_period`
+                (defaults to the documented quota for the key in use)
+            ss_time_period: Semantic Scholar rate limit window in seconds
+            write_batch_size: Number of papers written to Neo4j per UNWIND
+                transaction; larger batches mean fewer round trips
+        """
+        if rate_limit_delay is not None:
+            warnings.warn(
+                "rate_limit_delay is ignored; use ss_max_rate/ss_time_period to "
+                "size the Semantic Scholar rate limiter instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         self.pdf_reader = PyMuPDFReader()
         self.reference_extractor = ReferenceExtractor(ReferencePattern.BRACKETED_NUMBER)
         self.details_extractor = ReferenceDetailsExtractor()
         self.graph_builder = AcademicGraphBuilder(
-            uri=neo4j_uri, user=neo4j_user, password=neo4j_password, api_key=ss_api_key
+            uri=neo4j_uri,
+            user=neo4j_user,
+            password=neo4j_password,
+            api_key=ss_api_key,
+            batch_size=write_batch_size,
+            use_cache=use_cache,
+            max_rate=ss_max_rate,
+            time_period=ss_time_period,
         )
-        self.rate_limit_delay = rate_limit_delay
+
+    def _extract_references(
+        self, pdf_path: str, reference_pages: List[int]
+    ) -> List[Tuple[int, str]]:
+        """
+        Collect (reference number, reference text) pairs across the selected pages.
+
+        Selections of at least MIN_PAGES_FOR_PARALLEL pages are extracted by
+        `to_list` on a process pool. Shorter ones are streamed from a single
+        open handle, where process start-up would cost more than it saves.
+        Pairs are chained straight into one list in document order. Nothing
+        downstream looks references up by number, so no dict is built;
+        repeated entries are dropped by title in the builder.
+        """
+
+        def extract(pages) -> List[Tuple[int, str]]:
+            return list(
+                chain.from_iterable(
+                    self.reference_extractor.iter_extract(page_text)
+                    for page_text in pages
+                )
+            )
+
+        if len(reference_pages or ()) >= MIN_PAGES_FOR_PARALLEL:
+            return extract(self.pdf_reader.to_list(pdf_path, reference_pages))
+        with self.pdf_reader.open(pdf_path) as doc:
+            return extract(self.pdf_reader.extract_pages(doc, reference_pages))
 
     def process_pdf_to_graph(
         self,
@@ -51,21 +117,11 @@ class PDFToKnowledgeGraphOrchestrator:
         Returns:
             Tuple of (successful_additions, unsuccessful_additions)
         """
-        # Step 1: Extract text from PDF pages
-        pages = self.pdf_reader.to_list(path=pdf_path, select_pages=reference_pages)
-
-        # Step 2: Extract references
-        references = {}
-        for page_text in pages:
-            references.update(self.reference_extractor.extract(text=page_text))
+        # Step 1 & 2: Extract text from PDF pages and references, one page at a time
+        references = self._extract_references(pdf_path, reference_pages)
 
         # Step 3: Parse reference details
-        references_details = []
-        for ref_id, ref_text in references.items():
-            details = self.details_extractor.parse_with_regex(
-                ref_id=ref_id, ref_text=ref_text
-            )
-            references_details.append(details)
+        references_details = self.details_extractor.parse_many(references)
 
         # Step 4: Build knowledge graph
         successful, unsuccessful = self.graph_builder.add_paper_with_citations(
@@ -100,7 +156,6 @@ class PDFToKnowledgeGraphOrchestrator:
             max_papers: Maximum number of papers from PDF references to add (None for all)
             include_citations: Whether to fetch and add citing papers for each paper
             max_citations_per_paper: Maximum number of citing papers to add per paper
-            rate_limit_delay: Delay between API calls in seconds (default: 1.0)
 
         Returns:
             Tuple of (statistics_dict, unsuccessful_additions)
@@ -111,22 +166,11 @@ class PDFToKnowledgeGraphOrchestrator:
                 - total_papers: Total papers added
                 - total_relationships: Total citation relationships created
         """
-        # Step 1: Extract text from PDF pages
-        pages = self.pdf_reader.to_list(path=pdf_path, select_pages=reference_pages)
+        # Step 1 & 2: Extract text from PDF pages and references, one page at a time
+        references = self._extract_references(pdf_path, reference_pages)
 
-        # Step 2: Extract references
-        references = {}
-        for page_text in pages:
-            references.update(self.reference_extractor.extract(text=page_text))
-
-        # Step 3: Parse reference details
-        references_details = []
-        for ref_id, ref_text in references.items():
-            details = self.details_extractor.parse_with_regex(
-                ref_id=ref_id, ref_text=ref_text
-            )
-            if details:  # Possible to get None
-                references_details.append(details)
+        # Step 3: Parse reference details lazily, as the graph builder asks for them
+        references_details = self.details_extractor.iter_many(references)
 
         # Step 4: Build knowledge graph with citation network
         stats, unsuccessful = self.graph_builder.add_paper_with_citation_network(
@@ -135,7 +179,6 @@ class PDFToKnowledgeGraphOrchestrator:
             max_papers=max_papers,
             include_citations=include_citations,
             max_citations_per_paper=max_citations_per_paper,
-            rate_limit_delay=self.rate_limit_delay,
         )
 
         return stats, unsuccessful
@@ -150,56 +193,72 @@ class PDFToKnowledgeGraphOrchestrator:
         """
         Based On run type fetch paper to process
 
+        Requests are throttled by the Semantic Scholar client's rate limiter;
+        for "all", references and citations are fetched concurrently.
+        """
+        return run_sync(
+            self._closing_ss_client(
+                self._get_paper_to_process_async(
+                    parent_paper_details,
+                    citation_network_type,
+                    max_citations_per_paper,
+                    publication_year,
+                )
+            )
+        )
+
+    async def _closing_ss_client(self, coro):
+        """
+        Await `coro`, then close the Semantic Scholar async client.
 
+        The client is bound to the event loop it was first used on, so it has
+        to be closed before the loop started by `run_sync` finishes.
         """
-        all_paper_to_process = []
-        if citation_network_type == "references":
+        try:
+            return await coro
+        finally:
+            await self.graph_builder.ss_client.aclose()
+
+    async def _get_paper_to_process_async(
+        self,
+        parent_paper_details,
+        citation_network_type,
+        max_citations_per_paper,
+        publication_year,
+    ):
+        """Async body of `get_parper_to_process`."""
+        ss_client = self.graph_builder.ss_client
+        fetches = []
+        if citation_network_type in ("references", "all"):
             # Step 2.1: Extract Reference from Parent Paper
-            time.sleep(self.rate_limit_delay)
-            parent_paper_references = self.graph_builder.ss_client.get_paper_references(
-                paper_id=parent_paper_details["paperId"],
-                limit=max_citations_per_paper,
-                publication_year=publication_year,
-            )
-            logger.info(
-                f"Number of Reference collections: {len(parent_paper_references['data'])}"
+            fetches.append(
+                ss_client.get_paper_references_async(
+                    paper_id=parent_paper_details["paperId"],
+                    limit=max_citations_per_paper,
+                    publication_year=publication_year,
+                )
             )
-            all_paper_to_process.extend(parent_paper_references["data"])
-
-        elif citation_network_type == "citations":
-            time.sleep(self.rate_limit_delay)
+        if citation_network_type in ("citations", "all"):
             # Step 2.2: Extract Citation from Parent Paper
-            parent_paper_citations = self.graph_builder.ss_client.get_paper_citations(
-                paper_id=parent_paper_details["paperId"],
-                limit=max_citations_per_paper,
-                publication_year=publication_year,
-            )
-            logger.info(
-                f"Number of Citation collections: {len(parent_paper_citations['data'])}"
-            )
-            all_paper_to_process.extend(parent_paper_citations["data"])
-
-        elif citation_network_type == "all":
-            time.sleep(self.rate_limit_delay)
-            parent_paper_references = self.graph_builder.ss_client.get_paper_references(
-                paper_id=parent_paper_details["paperId"],
-                limit=max_citations_per_paper,
-                publication_year=publication_year,
-            )
-            all_paper_to_process.extend(parent_paper_references["data"])
-            time.sleep(self.rate_limit_delay)
-            parent_paper_citations = self.graph_builder.ss_client.get_paper_citations(
-                paper_id=parent_paper_details["paperId"],
-                limit=max_citations_per_paper,
-                publication_year=publication_year,
-            )
-            all_paper_to_process.extend(parent_paper_citations["data"])
-            logger.info(
-                f"Number of Reference and Citation collections: {len(all_paper_to_process)}"
+            fetches.append(
+                ss_client.get_paper_citations_async(
+                    paper_id=parent_paper_details["paperId"],
+                    limit=max_citations_per_paper,
+                    publication_year=publication_year,
+                )
             )
 
-        return all_paper_to_process
+        responses = await asyncio.gather(*fetches)
+
+        all_paper_to_process = []
+        for response in responses:
+            all_paper_to_process.extend((response or {}).get("data", []))
+        logger.info(
+            f"Number of {citation_network_type} collections: "
+            f"{len(all_paper_to_process)}"
+        )
 
+        return all_paper_to_process
 
     def process_title_to_graph_with_network(
         self,
@@ -207,7 +266,7 @@ class PDFToKnowledgeGraphOrchestrator:
         include_citations: bool = True,
         max_citations_per_paper: int = 100,
         citation_network_type: Literal["references", "citations", "all"] = "citations",
-        rate_limit_delay: float = 1.0,
+        rate_limit_delay: Optional[float] = None,
         publication_year: Optional[str] = None,
     ):
         """
@@ -217,15 +276,53 @@ class PDFToKnowledgeGraphOrchestrator:
             include_citations: Whether to fetch and add citing papers for each paper
             max_citations_per_paper: Maximum number of citing papers to add per paper
             citation_network_type: Option fetch papers.
-            rate_limit_delay: Delay between API calls in seconds (default: 1.0)
+            rate_limit_delay: Deprecated and ignored. Citation fetches are
+                throttled by the Semantic Scholar client's rate limiter.
             publication_year: Filter by publication year. e.g 2023:2025
 
         If title did not match raise error.
         """
+        if rate_limit_delay is not None:
+            warnings.warn(
+                "rate_limit_delay is ignored; use ss_max_rate/ss_time_period to "
+                "size the Semantic Scholar rate limiter instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
 
+        return run_sync(
+            self._closing_ss_client(
+                self.aprocess_title_to_graph_with_network(
+                    parent_paper_title=parent_paper_title,
+                    include_citations=include_citations,
+                    max_citations_per_paper=max_citations_per_paper,
+                    citation_network_type=citation_network_type,
+                    publication_year=publication_year,
+                )
+            )
+        )
+
+    async def aprocess_title_to_graph_with_network(
+        self,
+        parent_paper_title: str,
+        include_citations: bool = True,
+        max_citations_per_paper: int = 100,
+        citation_network_type: Literal["references", "citations", "all"] = "citations",
+        publication_year: Optional[str] = None,
+    ):
+        """
+        Async variant of `process_title_to_graph_with_network`.
+
+        The title lookup, the concurrent reference/citation fetches and the
+        graph build all run on the caller's event loop, reusing one Semantic
+        Scholar connection pool instead of starting a loop per step. Close the
+        client with `graph_builder.ss_client.aclose()` before that loop ends.
+        """
         # Step 1: Check paper exist in semantic scholar.
-        parent_paper_details = self.graph_builder.ss_client.get_paper_by_title(
-            title=parent_paper_title
+        parent_paper_details = (
+            await self.graph_builder.ss_client.get_paper_by_title_async(
+                title=parent_paper_title
+            )
         )
         if not parent_paper_details:
             raise ValueError(f"Parent paper title {parent_paper_title} was not found.")
@@ -234,7 +331,7 @@ class PDFToKnowledgeGraphOrchestrator:
         )
 
         # Step 2: Extract Reference and Citation from Parent Paper
-        paper_to_process = self.get_parper_to_process(
+        paper_to_process = await self._get_paper_to_process_async(
             parent_paper_details,
             citation_network_type,
             max_citations_per_paper,
@@ -242,15 +339,10 @@ class PDFToKnowledgeGraphOrchestrator:
         )
 
         # Step 3: Build knowledge graph with citation network
-        stats, unsuccessful = (
-            self.graph_builder.add_paper_with_citation_network_from_api(
-                parent_paper_details=parent_paper_details,
-                paper_to_process=paper_to_process or [],
-                include_citations=include_citations,
-                max_citations_per_paper=max_citations_per_paper,
-                rate_limit_delay=rate_limit_delay,
-                publication_year=publication_year,
-            )
+        return await self.graph_builder.aadd_paper_with_citation_network_from_api(
+            parent_paper_details=parent_paper_details,
+            paper_to_process=paper_to_process or [],
+            include_citations=include_citations,
+            max_citations_per_paper=max_citations_per_paper,
+            publication_year=publication_year,
         )
-
-        return stats, unsuccessful
@@ -1,6 +1,34 @@
+import re
 from enum import Enum
 
 
 class ReferencePattern(str, Enum):
     BRACKETED_NUMBER = r"\[(\d+)\](.*?)(?=\[\d+\]|$)"
     NUMBERED_LIST = r"(\d+)\.(.*?)(?=\d+\.|$)"
+
+    @property
+    def compiled(self) -> re.Pattern:
+        """The pattern compiled with re.DOTALL, shared by every extractor."""
+        return _COMPILED_PATTERNS[self]
+
+    @property
+    def marker(self) -> re.Pattern:
+        """
+        The reference label alone, capturing the number.
+
+        Splitting on the label yields the same entries as the full pattern, but
+        each label is found in one pass instead of re-testing the lookahead at
+        every character of every reference.
+        """
+        return _MARKERS[self]
+
+
+# Compiled once at import time rather than per extractor instance
+_COMPILED_PATTERNS = {
+    pattern: re.compile(pattern.value, re.DOTALL) for pattern in ReferencePattern
+}
+
+_MARKERS = {
+    ReferencePattern.BRACKETED_NUMBER: re.compile(r"\[(\d+)\]"),
+    ReferencePattern.NUMBERED_LIST: re.compile(r"(\d+)\."),
+}
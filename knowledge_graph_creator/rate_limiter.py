@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter usable from both sync and async code.
+
+    Allows up to ``max_rate`` acquisitions per ``time_period`` seconds and only
+    blocks once the bucket is empty, instead of sleeping a fixed delay per call.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        """
+        Args:
+            max_rate: Number of acquisitions allowed per time period
+            time_period: Length of the time period in seconds
+        """
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive.")
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller has to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self._last_refill) * self.max_rate / self.time_period
+            self._tokens = min(self.max_rate, self._tokens + refill)
+            self._last_refill = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.time_period / self.max_rate
+
+    def acquire(self):
+        """Block the current thread until a token is available."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        """Suspend the current coroutine until a token is available."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    async def __aenter__(self):
+        await self.aacquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
@@ -1,68 +1,325 @@
+import asyncio
 import os
-from typing import Any, Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
 
+import httpx
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from knowledge_graph_creator.cache import DEFAULT_CACHE_PATH, DiskCache
+from knowledge_graph_creator.rate_limiter import RateLimiter
+from knowledge_graph_creator.utils import (
+    chunked,
+    json_loads,
+    normalize_title,
+    title_similarity,
+)
+
+# Maximum number of IDs accepted by the /paper/batch endpoint per request
+BATCH_MAX_IDS = 500
+
+# Transient statuses retried with exponential backoff: rate limiting and
+# gateway errors the API returns under load
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0
+
+# Paper attributes requested from the search, paper and batch endpoints
+PAPER_FIELDS = (
+    "paperId,corpusId,url,title,abstract,venue,publicationVenue,year,"
+    "referenceCount,citationCount,influentialCitationCount,isOpenAccess,"
+    "openAccessPdf,fieldsOfStudy,s2FieldsOfStudy,publicationTypes,"
+    "publicationDate,journal,authors"
+)
+
+# Citation edges additionally carry whether the citation is influential
+CITATION_FIELDS = PAPER_FIELDS.replace(
+    "citationCount,", "citationCount,isInfluential,", 1
+)
+
+# Minimum normalised Levenshtein similarity for a title match to be accepted
+TITLE_MATCH_THRESHOLD = 0.9
+
+# Number of resolved titles kept in memory per client
+TITLE_CACHE_SIZE = 10000
+
+# Timeout in seconds for each HTTP request
+REQUEST_TIMEOUT = 30
 
 
 class SemanticScholarClient:
     """Client for interacting with Semantic Scholar API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Documented limits: shared pool without a key, dedicated budget with one
+    UNAUTHENTICATED_RATE = (100, 300.0)
+    AUTHENTICATED_RATE = (100, 1.0)
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_rate: Optional[float] = None,
+        time_period: Optional[float] = None,
+        use_cache: bool = True,
+        cache_path: str = DEFAULT_CACHE_PATH,
+        rate_limiter: Optional[RateLimiter] = None,
+        min_title_similarity: float = TITLE_MATCH_THRESHOLD,
+    ):
+        """
+        Args:
+            api_key: Semantic Scholar API key (falls back to SS_API_KEY)
+            max_rate: Maximum number of API calls per time period
+            time_period: Rate limit window in seconds
+            use_cache: Whether to cache successful GET responses on disk
+            cache_path: SQLite file backing the response cache
+            rate_limiter: Token bucket to draw from instead of a private one.
+                The quota applies per API key, so clients sharing a key should
+                share a limiter; `max_rate`/`time_period` are then ignored.
+            min_title_similarity: Similarity a title search result must reach
+                to be accepted (0 accepts the API's first match)
+
+        Without `max_rate`/`time_period` the limit defaults to 100 calls per
+        second with an API key and 100 calls per 5 minutes without one.
+        """
         self.api_key = api_key or self._get_api_key()
         self.base_url = "https://api.semanticscholar.org/graph/v1"
-        self.headers = {"x-api-key": self.api_key}
+        self.headers = {"x-api-key": self.api_key} if self.api_key else {}
+
+        default_rate, default_period = (
+            self.AUTHENTICATED_RATE if self.api_key else self.UNAUTHENTICATED_RATE
+        )
+        self.rate_limiter = rate_limiter or RateLimiter(
+            max_rate=max_rate or default_rate,
+            time_period=time_period or default_period,
+        )
+        self.min_title_similarity = min_title_similarity
+        self.session = self._build_session()
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self.cache: Optional[DiskCache] = DiskCache(cache_path) if use_cache else None
+        self._title_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._title_cache_lock = threading.Lock()
 
     @staticmethod
-    def _get_api_key() -> str:
+    def _get_api_key() -> Optional[str]:
         """Retrieve the API key from environment variables."""
         api_key = os.getenv("SS_API_KEY")
         if not api_key:
-            raise ValueError(
-                "API key not found. Please set the SS_API_KEY environment variable."
+            logger.warning(
+                "SS_API_KEY is not set, using the unauthenticated rate limit."
             )
         return api_key
 
+    def _build_session(self) -> requests.Session:
+        """
+        Create the keep-alive session shared by the sync methods.
+
+        Reusing pooled connections avoids a TCP and TLS handshake per call, and
+        the adapter retries transient statuses with backoff, honouring
+        Retry-After, the same way `_get_json_async` does.
+        """
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=BACKOFF_BASE,
+            status_forcelist=RETRY_STATUSES,
+            # /paper/batch is a read-only POST, safe to repeat
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("https://", adapter)
+        return session
+
+    @staticmethod
+    def _response_json(response: Any) -> Any:
+        """
+        Decode a sync or async response, mapping HTTP failures to an "error" key.
+
+        Callers already check for "error", and the cache skips such responses.
+        The body is decoded from raw bytes with orjson when it is available,
+        which is several times faster on large citation pages.
+        """
+        status_code = response.status_code
+        try:
+            data = json_loads(response.content)
+        except ValueError:
+            # e.g. an HTML error page from a gateway
+            return {"error": f"HTTP {status_code}: response is not valid JSON"}
+        if status_code >= 400 and not (isinstance(data, dict) and "error" in data):
+            data = {"error": f"HTTP {status_code}: {data}"}
+        return data
+
+    def _get_json(self, url: str, params: Dict[str, Any]) -> Any:
+        """GET `url` as JSON, serving repeated requests from the disk cache."""
+        key = DiskCache.make_key(url, params)
+        if self.cache is not None and (cached := self.cache.get(key)) is not None:
+            return cached
+
+        self.rate_limiter.acquire()
+        response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        data = self._response_json(response)
+        if self.cache is not None and "error" not in data:
+            self.cache.set(key, data)
+        return data
+
+    async def _get_json_async(self, url: str, params: Dict[str, Any]) -> Any:
+        """Async variant of `_get_json`."""
+        key = DiskCache.make_key(url, params)
+        if self.cache is not None and (cached := self.cache.get(key)) is not None:
+            return cached
+
+        for attempt in range(MAX_RETRIES + 1):
+            async with self.rate_limiter:
+                response = await self._get_async_client().get(url, params=params)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+            delay = self._retry_delay(response.headers.get("Retry-After"), attempt)
+            logger.warning(
+                f"Semantic Scholar returned {response.status_code}, "
+                f"retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+        data = self._response_json(response)
+        if self.cache is not None and "error" not in data:
+            self.cache.set(key, data)
+        return data
+
+    @staticmethod
+    def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+        """Seconds to wait before retry `attempt`, honouring Retry-After."""
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return BACKOFF_BASE * 2**attempt
+
+    def _match_title(
+        self, title: str, candidates: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the first candidate whose title is close enough to `title`.
+
+        Rejecting a wrong match here is far cheaper than building a citation
+        network around the wrong paper.
+        """
+        for candidate in candidates:
+            similarity = title_similarity(title, candidate.get("title"))
+            if similarity >= self.min_title_similarity:
+                return candidate
+            logger.debug(
+                f"Rejected title match '{candidate.get('title')}' for '{title}' "
+                f"(similarity {similarity:.2f})"
+            )
+        return None
+
+    def _cached_title(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the paper already resolved for a normalised title, if any."""
+        with self._title_cache_lock:
+            paper = self._title_cache.get(key)
+            if paper is not None:
+                self._title_cache.move_to_end(key)
+            return paper
+
+    def _remember_title(self, key: str, paper: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a resolved paper, evicting the least recently used title."""
+        if key:
+            with self._title_cache_lock:
+                self._title_cache[key] = paper
+                self._title_cache.move_to_end(key)
+                if len(self._title_cache) > TITLE_CACHE_SIZE:
+                    self._title_cache.popitem(last=False)
+        return paper
+
     def get_paper_by_title(self, title: str) -> Optional[Dict[str, Any]]:
-        """Fetch paper JSON from Semantic Scholar API based on the paper title."""
+        """
+        Fetch paper JSON from Semantic Scholar API based on the paper title.
+
+        Results whose title is less similar than `min_title_similarity` are
+        rejected. Titles that differ only in case, punctuation or whitespace
+        resolve once per client; repeats are served from an in-memory LRU cache
+        in front of the disk cache.
+        """
+        key = normalize_title(title)
+        if (paper := self._cached_title(key)) is not None:
+            return paper
+
         try:
             url = f"{self.base_url}/paper/search/match"
-            query_params = {
-                "query": title,
-                "fields": "paperId,corpusId,url,title,abstract,venue,publicationVenue,year,"
-                "referenceCount,citationCount,influentialCitationCount,isOpenAccess,"
-                "openAccessPdf,fieldsOfStudy,s2FieldsOfStudy,publicationTypes,"
-                "publicationDate,journal,authors",
-            }
-            response = requests.get(
-                url, params=query_params, headers=self.headers
-            ).json()
+            query_params = {"query": " ".join(title.split()), "fields": PAPER_FIELDS}
+            response = self._get_json(url, query_params)
 
             if "error" in response:
                 print(f"API Error for query '{title}': {response['error']}")
                 return None
 
-            if not response.get("data"):
+            paper = self._match_title(title, response.get("data") or [])
+            if paper is None:
                 return None
 
-            return response["data"][0]
+            return self._remember_title(key, paper)
         except Exception as e:
             print(f"Error fetching paper JSON for query '{title}': {e}")
             return None
 
+    async def get_paper_by_title_async(self, title: str) -> Optional[Dict[str, Any]]:
+        """Async variant of `get_paper_by_title`, safe to gather concurrently."""
+        key = normalize_title(title)
+        if (paper := self._cached_title(key)) is not None:
+            return paper
+
+        try:
+            url = f"{self.base_url}/paper/search/match"
+            query_params = {"query": " ".join(title.split()), "fields": PAPER_FIELDS}
+            response = await self._get_json_async(url, query_params)
+
+            if "error" in response:
+                logger.error(f"API Error for query '{title}': {response['error']}")
+                return None
+
+            paper = self._match_title(title, response.get("data") or [])
+            if paper is None:
+                return None
+
+            return self._remember_title(key, paper)
+        except Exception as e:
+            logger.error(f"Error fetching paper JSON for query '{title}': {e}")
+            return None
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Lazily create the async HTTP client shared by the async methods."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers=self.headers, timeout=REQUEST_TIMEOUT
+            )
+        return self._async_client
+
+    def close(self):
+        """Close the pooled connections of the sync HTTP session."""
+        self.session.close()
+
+    async def aclose(self):
+        """
+        Close the async HTTP client.
+
+        The client is bound to the running event loop, so call this before the
+        loop started with `asyncio.run` finishes.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
     def get_paper_by_id(self, paper_id: str) -> Optional[Dict[str, Any]]:
         """Fetch paper JSON from Semantic Scholar API based on the paper ID."""
         try:
             url = f"{self.base_url}/paper/{paper_id}"
-            query_params = {
-                "fields": "paperId,corpusId,url,title,abstract,venue,publicationVenue,year,"
-                "referenceCount,citationCount,influentialCitationCount,isOpenAccess,"
-                "openAccessPdf,fieldsOfStudy,s2FieldsOfStudy,publicationTypes,"
-                "publicationDate,journal,authors",
-            }
-            response = requests.get(
-                url, params=query_params, headers=self.headers
-            ).json()
+            query_params = {"fields": PAPER_FIELDS}
+            response = self._get_json(url, query_params)
 
             if "error" in response:
                 print(f"API Error for paper ID '{paper_id}': {response['error']}")
@@ -73,6 +330,112 @@ class SemanticScholarClient:
             print(f"Error fetching paper JSON for paper ID '{paper_id}': {e}")
             return None
 
+    async def get_paper_by_id_async(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Async variant of `get_paper_by_id`, safe to gather concurrently."""
+        try:
+            url = f"{self.base_url}/paper/{paper_id}"
+            query_params = {"fields": PAPER_FIELDS}
+            response = await self._get_json_async(url, query_params)
+
+            if "error" in response:
+                logger.error(
+                    f"API Error for paper ID '{paper_id}': {response['error']}"
+                )
+                return None
+
+            return response
+        except Exception as e:
+            logger.error(f"Error fetching paper JSON for paper ID '{paper_id}': {e}")
+            return None
+
+    async def get_paper_by_id_many(
+        self, paper_ids: Iterable[str], max_concurrency: int = 10
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch many papers by ID concurrently.
+
+        At most `max_concurrency` requests are in flight, on top of the rate
+        limiter. Prefer `get_papers_batch` for large ID lists; this suits IDs
+        that arrive incrementally or need per-paper caching.
+
+        Returns:
+            Paper JSON for each ID in input order, None where the fetch failed
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(paper_id: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_paper_by_id_async(paper_id)
+
+        return await asyncio.gather(*(fetch(paper_id) for paper_id in paper_ids))
+
+    def get_papers_batch(
+        self, paper_ids: Iterable[str], batch_size: int = BATCH_MAX_IDS
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch paper JSON for many paper IDs via the /paper/batch endpoint.
+
+        IDs are sent in chunks of up to 500, collapsing N round trips into
+        N / 500. Accepts any ID format supported by the API (S2 paper ID,
+        "DOI:...", "ARXIV:...", "CorpusId:...").
+
+        Args:
+            paper_ids: Paper identifiers to fetch
+            batch_size: Number of IDs per request (max 500)
+
+        Returns:
+            Paper JSON for each ID in input order, None for IDs that were not
+            found or whose batch request failed.
+
+        Papers are cached under the same key as `get_paper_by_id`, so IDs
+        resolved by either method are not requested again, and repeated IDs
+        are only sent once.
+        """
+        url = f"{self.base_url}/paper/batch"
+        query_params = {"fields": PAPER_FIELDS}
+
+        paper_ids = list(paper_ids)
+        papers: List[Optional[Dict[str, Any]]] = [None] * len(paper_ids)
+        pending: Dict[str, List[int]] = {}
+        for index, paper_id in enumerate(paper_ids):
+            cached = self.cache.get(self._paper_key(paper_id)) if self.cache else None
+            if cached is not None:
+                papers[index] = cached
+            else:
+                pending.setdefault(paper_id, []).append(index)
+
+        for chunk in chunked(pending, min(batch_size, BATCH_MAX_IDS)):
+            try:
+                self.rate_limiter.acquire()
+                response = self._response_json(
+                    self.session.post(
+                        url,
+                        params=query_params,
+                        json={"ids": chunk},
+                        timeout=REQUEST_TIMEOUT,
+                    )
+                )
+
+                if "error" in response:
+                    logger.error(f"API Error fetching paper batch: {response['error']}")
+                    continue
+
+                for paper_id, paper in zip(chunk, response):
+                    for index in pending[paper_id]:
+                        papers[index] = paper
+                    if paper and self.cache is not None:
+                        self.cache.set(self._paper_key(paper_id), paper)
+            except Exception as e:
+                logger.error(f"Error fetching paper batch of {len(chunk)} IDs: {e}")
+
+        return papers
+
+    def _paper_key(self, paper_id: str) -> str:
+        """Cache key of the /paper/{paper_id} response with the default fields."""
+        return DiskCache.make_key(
+            f"{self.base_url}/paper/{paper_id}", {"fields": PAPER_FIELDS}
+        )
+
     def get_paper_citations(
         self,
         paper_id: str,
@@ -110,17 +473,12 @@ class SemanticScholarClient:
         try:
             url = f"{self.base_url}/paper/{paper_id}/citations"
             query_params = {
-                "fields": "paperId,corpusId,url,title,abstract,venue,publicationVenue,year,"
-                "referenceCount,citationCount,isInfluential,influentialCitationCount,isOpenAccess,"
-                "openAccessPdf,fieldsOfStudy,s2FieldsOfStudy,publicationTypes,"
-                "publicationDate,journal,authors",
+                "fields": CITATION_FIELDS,
                 "publicationDateOrYear": publication_year,
                 "limit": min(limit, 1000),  # API max is 1000
                 "offset": offset,
             }
-            response = requests.get(
-                url, params=query_params, headers=self.headers
-            ).json()
+            response = self._get_json(url, query_params)
 
             if "error" in response:
                 print(
@@ -133,6 +491,66 @@ class SemanticScholarClient:
             print(f"Error fetching citations for paper '{paper_id}': {e}")
             return None
 
+    async def get_paper_citations_async(
+        self,
+        paper_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        publication_year: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Async variant of `get_paper_citations`, safe to gather concurrently."""
+        try:
+            url = f"{self.base_url}/paper/{paper_id}/citations"
+            query_params = {
+                "fields": CITATION_FIELDS,
+                "limit": min(limit, 1000),  # API max is 1000
+                "offset": offset,
+            }
+            if publication_year:
+                query_params["publicationDateOrYear"] = publication_year
+
+            response = await self._get_json_async(url, query_params)
+
+            if "error" in response:
+                logger.error(
+                    f"API Error fetching citations for paper '{paper_id}': {response['error']}"
+                )
+                return None
+
+            return response
+        except Exception as e:
+            logger.error(f"Error fetching citations for paper '{paper_id}': {e}")
+            return None
+
+    async def get_paper_citations_many(
+        self,
+        paper_ids: Iterable[str],
+        limit: int = 100,
+        publication_year: Optional[str] = None,
+        max_concurrency: int = 10,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch the first citation page of many papers concurrently.
+
+        Args:
+            paper_ids: Semantic Scholar paper IDs
+            limit: Maximum number of citations to fetch per paper (max 1000)
+            publication_year: Filter citations by publication year, e.g., 2022:2023
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Citation response for each ID in input order, None where it failed
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(paper_id: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_paper_citations_async(
+                    paper_id=paper_id, limit=limit, publication_year=publication_year
+                )
+
+        return await asyncio.gather(*(fetch(paper_id) for paper_id in paper_ids))
+
     def get_paper_references(
         self,
         paper_id: str,
@@ -153,17 +571,12 @@ class SemanticScholarClient:
         try:
             url = f"{self.base_url}/paper/{paper_id}/references"
             query_params = {
-                "fields": "paperId,corpusId,url,title,abstract,venue,publicationVenue,year,"
-                "referenceCount,citationCount,influentialCitationCount,isOpenAccess,"
-                "openAccessPdf,fieldsOfStudy,s2FieldsOfStudy,publicationTypes,"
-                "publicationDate,journal,authors",
+                "fields": PAPER_FIELDS,
                 "publicationDateOrYear": publication_year,
                 "limit": min(limit, 1000),  # API max is 1000
                 "offset": offset,
             }
-            response = requests.get(
-                url, params=query_params, headers=self.headers
-            ).json()
+            response = self._get_json(url, query_params)
 
             if "error" in response:
                 logger.error(
@@ -176,3 +589,34 @@ class SemanticScholarClient:
         except Exception as e:
             print(f"Error fetching citations for paper '{paper_id}': {e}")
             return None
+
+    async def get_paper_references_async(
+        self,
+        paper_id: str,
+        limit: int = 500,
+        offset: int = 0,
+        publication_year: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Async variant of `get_paper_references`, safe to gather concurrently."""
+        try:
+            url = f"{self.base_url}/paper/{paper_id}/references"
+            query_params = {
+                "fields": PAPER_FIELDS,
+                "limit": min(limit, 1000),  # API max is 1000
+                "offset": offset,
+            }
+            if publication_year:
+                query_params["publicationDateOrYear"] = publication_year
+
+            response = await self._get_json_async(url, query_params)
+
+            if "error" in response:
+                logger.error(
+                    f"API Error fetching references for paper '{paper_id}': {response['error']}"
+                )
+                return None
+
+            return response
+        except Exception as e:
+            logger.error(f"Error fetching references for paper '{paper_id}': {e}")
+            return None
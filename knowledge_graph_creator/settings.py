@@ -1,6 +1,8 @@
 # knowledge_graph_creator/settings.py
 
+from functools import lru_cache
 from typing import Optional
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -29,13 +31,12 @@ class Settings(BaseSettings):
     )
 
 
-# Singleton instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """
+    Get cached settings instance.
+
+    The environment and .env file are parsed once; call
+    `get_settings.cache_clear()` to reload them, e.g. between tests.
+    """
+    return Settings()
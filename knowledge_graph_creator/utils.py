@@ -1 +1,110 @@
 # Utility functions for the creator package
+import asyncio
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Coroutine,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+try:
+    import orjson
+except ImportError:  # optional dependency (installed with langsmith on CPython)
+    orjson = None
+
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:  # optional dependency, fall back to a pure-Python distance
+    Levenshtein = None
+
+T = TypeVar("T")
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses `asyncio.run` normally; when an event loop is already running in this
+    thread (e.g. inside a Jupyter notebook) the coroutine runs on a fresh loop
+    in a worker thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield successive lists of at most `size` items from `items`."""
+    if size < 1:
+        raise ValueError("size must be at least 1.")
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Lowercase a title and drop punctuation and repeated whitespace for matching."""
+    if not title:
+        return ""
+    return " ".join(_PUNCTUATION_RE.sub("", title).lower().split())
+
+
+def _levenshtein_distance(a: str, b: str) -> int:
+    """Edit distance between two strings, computed row by row."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def title_similarity(a: Optional[str], b: Optional[str]) -> float:
+    """
+    Normalised Levenshtein similarity (0.0 to 1.0) of two normalised titles.
+
+    Uses rapidfuzz when it is installed.
+    """
+    a, b = normalize_title(a), normalize_title(b)
+    if not a or not b:
+        return 0.0
+    if Levenshtein is not None:
+        return Levenshtein.normalized_similarity(a, b)
+    return 1.0 - _levenshtein_distance(a, b) / max(len(a), len(b))
+
+
+def json_dumps(value: Any) -> str:
+    """Serialise `value` to a JSON string, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON string or UTF-8 bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
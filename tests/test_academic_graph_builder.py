@@ -0,0 +1,92 @@
+import unittest
+
+from knowledge_graph_creator.academic_graph_builder import AcademicGraphBuilder
+from knowledge_graph_creator.extractors.reference_details import ReferenceDetails
+
+
+def _reference(i):
+    return ReferenceDetails(
+        id_=i, authors="A. Author", year="2020", title=f"Paper {i}", publish=""
+    )
+
+
+class _FakeClient:
+    """Semantic Scholar client that finds every title except the `missing` ones."""
+
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.title_lookups = []
+
+    def get_paper_by_title(self, title):
+        return {"paperId": "parent", "title": title}
+
+    async def get_paper_by_title_async(self, title):
+        self.title_lookups.append(title)
+        if title in self.missing:
+            return None
+        return {"paperId": title, "title": title}
+
+    async def aclose(self):
+        pass
+
+
+class _FakeGraph:
+    def __init__(self):
+        self.papers = []
+
+    def add_paper_from_json(self, paper_data, return_paper_id=False):
+        return paper_data["paperId"]
+
+    def add_papers_bulk(self, papers):
+        self.papers.extend(papers)
+
+    def add_citation_relationships_bulk(self, citations):
+        pass
+
+    def close(self):
+        pass
+
+
+def _builder(client):
+    builder = AcademicGraphBuilder.__new__(AcademicGraphBuilder)
+    builder.ss_client = client
+    builder.kg = _FakeGraph()
+    builder.batch_size = 500
+    return builder
+
+
+class TestAddPaperWithCitations(unittest.TestCase):
+    def setUp(self):
+        self.references = [_reference(i) for i in range(200)]
+
+    def test_max_papers_limits_title_lookups(self):
+        client = _FakeClient()
+        successful, unsuccessful = _builder(client).add_paper_with_citations(
+            _reference(-1), self.references, max_papers=5, max_concurrency=5
+        )
+        self.assertEqual(len(successful), 5)
+        self.assertEqual(unsuccessful, [])
+        self.assertEqual(len(client.title_lookups), 5)
+
+    def test_lookups_continue_past_missing_papers(self):
+        client = _FakeClient(missing={"Paper 1", "Paper 3"})
+        builder = _builder(client)
+        successful, unsuccessful = builder.add_paper_with_citations(
+            _reference(-1), self.references, max_papers=5, max_concurrency=5
+        )
+        self.assertEqual(len(successful), 5)
+        self.assertEqual(len(unsuccessful), 2)
+        self.assertEqual(len(client.title_lookups), 7)
+        self.assertEqual(len(builder.kg.papers), 5)
+
+    def test_without_max_papers_every_title_is_looked_up(self):
+        client = _FakeClient()
+        successful, _ = _builder(client).add_paper_with_citations(
+            _reference(-1), self.references, max_concurrency=5
+        )
+        self.assertEqual(len(successful), 200)
+        self.assertEqual(len(client.title_lookups), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from knowledge_graph_creator.cache import DiskCache
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = DiskCache(":memory:")
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_round_trip(self):
+        key = DiskCache.make_key("https://example.org/paper", {"query": "x"})
+        self.cache.set(key, {"data": [{"paperId": "1"}]})
+        self.assertEqual(self.cache.get(key), {"data": [{"paperId": "1"}]})
+
+    def test_key_ignores_param_order_and_nulls(self):
+        self.assertEqual(
+            DiskCache.make_key("u", {"a": 1, "b": 2, "c": None}),
+            DiskCache.make_key("u", {"b": 2, "a": 1}),
+        )
+
+    def test_expired_entry_is_ignored(self):
+        cache = DiskCache(":memory:", expire_after=-1)
+        cache.set("key", {"value": 1})
+        self.assertIsNone(cache.get("key"))
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import math
+import unittest
+from unittest import mock
+
+from knowledge_graph_creator.evaluator import KnowledgeGraphEvaluator
+
+
+def _edge(source, target, edge_type):
+    return {"source": source, "target": target, "type": edge_type}
+
+
+# D and E are listed but isolated; X and Y appear only as edge endpoints
+GRAPH = {
+    "nodes": {"A", "B", "C", "D", "E"},
+    "edges": [
+        _edge("A", "B", "Extends"),
+        _edge("A", "B", "Extends"),  # duplicate typed edge
+        _edge("B", "A", "Extends"),  # reverse of an asymmetric pair
+        _edge("C", "C", "Solves"),  # self-loop
+        _edge("A", "X", "Requires"),
+        _edge("Y", "B", "Validates"),
+        _edge("A", "B", "Contradicts"),  # conflicts with A-Extends->B
+        _edge("B", "C", "cites"),  # outside the taxonomy
+    ],
+}
+
+
+class TestEvaluateAll(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.results = KnowledgeGraphEvaluator(graph=GRAPH).evaluate_all()
+
+    def test_identification_distribution(self):
+        result = self.results["identification_distribution"]
+        self.assertEqual(result["total_edges"], 8)
+        self.assertEqual(
+            result["benefit_group_distribution"],
+            {
+                "learning_path": 3 / 8,
+                "problem_solution": 1 / 8,
+                "reliability": 2 / 8,
+                "performance": 0,
+                "prerequisites": 1 / 8,
+            },
+        )
+        self.assertAlmostEqual(result["balance_score"], 1 - 3 / 8)
+
+    def test_type_classification_quality(self):
+        result = self.results["type_classification_quality"]
+        self.assertEqual(result["taxonomy_coverage"], 0.5)
+        self.assertEqual(result["validity_rate"], 7 / 8)
+        self.assertEqual(result["invalid_types"], ["cites"])
+        self.assertEqual(result["type_counts"]["Extends"], 3)
+        entropy = -(3 / 7 * math.log2(3 / 7) + 4 * (1 / 7) * math.log2(1 / 7))
+        self.assertAlmostEqual(result["diversity_score"], entropy / math.log2(10))
+
+    def test_graph_coverage(self):
+        result = self.results["graph_coverage"]
+        self.assertEqual(result["num_nodes"], 5)
+        self.assertEqual(result["num_edges"], 8)
+        self.assertEqual(result["density"], 8 / 20)
+        self.assertEqual(result["avg_out_degree"], 8 / 5)
+        self.assertEqual(result["avg_in_degree"], 8 / 5)
+        self.assertEqual(result["max_out_degree"], 4)
+        self.assertEqual(result["max_in_degree"], 4)
+        # A, B, C, X and Y all have edges; endpoints outside `nodes` count as
+        # connected, as they always have
+        self.assertEqual(result["isolated_nodes"], 0)
+        self.assertEqual(result["connectivity_rate"], 1.0)
+        self.assertEqual(result["annotation_completeness"], 7 / 8)
+
+    def test_relationship_precision(self):
+        result = self.results["relationship_precision"]
+        self.assertEqual(result["self_loops"], 1)
+        self.assertEqual(result["duplicate_edges"], 1)
+        self.assertEqual(result["semantic_conflicts"], 1)
+        self.assertEqual(result["asymmetric_violations"], 2)
+        self.assertAlmostEqual(
+            result["heuristic_quality_score"],
+            1 - 0.2 / 8 - 0.2 / 8 - 0.3 / 8 - 0.3 * 2 / 8,
+        )
+
+
+class TestNeo4jDegreeStats(unittest.TestCase):
+    def test_node_count_matches_degree_stats(self):
+        fetcher = mock.Mock()
+        # Paper nodes have no `id`, so only two ids come back for five nodes
+        fetcher.fetch_graph.return_value = {
+            "nodes": {"a", "b"},
+            "edges": [_edge("a", "b", "Extends"), _edge("p1", "p2", "CITES")],
+        }
+        fetcher.fetch_degree_stats.return_value = {
+            "num_nodes": 5,
+            "avg_out": 0.4,
+            "avg_in": 0.4,
+            "max_out": 1,
+            "max_in": 1,
+            "isolated": 1,
+        }
+        with mock.patch(
+            "knowledge_graph_creator.evaluator.Neo4jGraphFetcher",
+            return_value=fetcher,
+        ):
+            evaluator = KnowledgeGraphEvaluator(
+                neo4j_config={"uri": "bolt://test", "user": "u", "password": "p"}
+            )
+        result = evaluator.calculate_graph_coverage()
+        self.assertEqual(result["num_nodes"], 5)
+        self.assertEqual(result["isolated_nodes"], 1)
+        self.assertEqual(result["connectivity_rate"], 4 / 5)
+        self.assertEqual(result["density"], 2 / 20)
+        fetcher.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
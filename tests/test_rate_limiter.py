@@ -0,0 +1,41 @@
+import asyncio
+import time
+import unittest
+
+from knowledge_graph_creator.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst_within_budget_does_not_block(self):
+        limiter = RateLimiter(max_rate=5, time_period=60)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_blocks_once_budget_exhausted(self):
+        limiter = RateLimiter(max_rate=2, time_period=0.2)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_async_acquire(self):
+        limiter = RateLimiter(max_rate=2, time_period=0.2)
+
+        async def run():
+            for _ in range(3):
+                async with limiter:
+                    pass
+
+        start = time.monotonic()
+        asyncio.run(run())
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(max_rate=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from knowledge_graph_creator.utils import chunked, normalize_title, title_similarity
+
+
+class TestChunked(unittest.TestCase):
+    def test_splits_into_fixed_size_chunks(self):
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_empty_input(self):
+        self.assertEqual(list(chunked([], 3)), [])
+
+    def test_rejects_zero_size(self):
+        with self.assertRaises(ValueError):
+            list(chunked([1], 0))
+
+
+class TestNormalizeTitle(unittest.TestCase):
+    def test_ignores_case_punctuation_and_spacing(self):
+        self.assertEqual(
+            normalize_title("  BERT: Pre-training of Deep\nTransformers. "),
+            normalize_title("bert pretraining of deep transformers"),
+        )
+
+    def test_empty_title(self):
+        self.assertEqual(normalize_title(None), "")
+
+
+class TestTitleSimilarity(unittest.TestCase):
+    def test_identical_after_normalisation(self):
+        self.assertEqual(
+            title_similarity("Attention Is All You Need.", "attention is all you need"),
+            1.0,
+        )
+
+    def test_single_edit(self):
+        self.assertAlmostEqual(title_similarity("abcd", "abce"), 0.75)
+
+    def test_unrelated_titles_score_low(self):
+        self.assertLess(
+            title_similarity("Attention Is All You Need", "Deep Residual Learning"),
+            0.5,
+        )
+
+    def test_missing_title(self):
+        self.assertEqual(title_similarity("A title", None), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()